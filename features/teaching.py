@@ -1331,6 +1331,10 @@ class TeachingSystem:
         self.translator = translator
         self._puzzle_texts: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self.lessons: Dict[str, Lesson] = {}
+        # 课程列表变化时递增，供界面层判断缓存是否失效
+        self.lessons_version = 0
+        self._sorted_lessons: Tuple[Lesson, ...] = ()
+        self._sorted_lessons_version = -1
         self.puzzles: Dict[str, Puzzle] = {}
         self.puzzle_db: Optional[PuzzleDatabase] = None
         self.user_progress: Dict[str, Any] = {
@@ -1356,6 +1360,7 @@ class TeachingSystem:
         # 战术课程
         self.lessons['tactics_ladder'] = self._create_ladder_lesson()
         self.lessons['tactics_net'] = self._create_net_lesson()
+        self.lessons_version += 1
     
     def _create_rules_lesson(self) -> Lesson:
         """创建规则课程"""
@@ -1657,6 +1662,15 @@ class TeachingSystem:
     def get_lesson(self, lesson_id: str) -> Optional[Lesson]:
         """获取课程"""
         return self.lessons.get(lesson_id)
+
+    def get_sorted_lessons(self) -> Tuple[Lesson, ...]:
+        """按难度排序的课程（课程列表不变时复用排序结果）"""
+        if self._sorted_lessons_version != self.lessons_version:
+            self._sorted_lessons = tuple(
+                sorted(self.lessons.values(), key=lambda l: l.difficulty.value)
+            )
+            self._sorted_lessons_version = self.lessons_version
+        return self._sorted_lessons
     
     def get_puzzle(self, puzzle_id: str) -> Optional[Puzzle]:
         """获取棋题"""
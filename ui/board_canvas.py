@@ -895,7 +895,38 @@ class BoardCanvas(Canvas):
         # 重绘提示点
         if self._hint_pos:
             self._draw_hint_marker(*self._hint_pos)
-    
+
+    def refresh_stones(self):
+        """仅重绘棋子、手数和最后一手标记，保留已绘制的背景、网格、星位与坐标"""
+        # 叠加层需要画在棋子之上，此时退回完整刷新以保证层次正确
+        if self.show_territory or self.show_influence or (
+            self.scoring_mode and self._dead_stones_marked
+        ):
+            self.refresh()
+            return
+
+        self.delete('stone')
+        self.renderer.stones.clear()
+        for y in range(self.board_size):
+            for x in range(self.board_size):
+                if self.board_state[y][x]:
+                    self.renderer.place_stone(x, y, self.board_state[y][x])
+
+        if self.show_move_numbers:
+            self.renderer.draw_move_numbers(self.move_numbers)
+        else:
+            self.delete('move_number')
+
+        if self.last_move:
+            self.renderer.mark_last_move(*self.last_move)
+        else:
+            self.delete('last_move_marker')
+
+        if self._hint_pos:
+            self._draw_hint_marker(*self._hint_pos)
+        else:
+            self.delete('hint')
+
     def show_territory_map(self, territory_map: List[List[str]]):
         """显示地盘图"""
         self.territory_map = territory_map
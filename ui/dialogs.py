@@ -20,7 +20,8 @@ class BaseDialog(tk.Toplevel):
                  theme: Optional[Theme] = None,
                  modal: bool = True,
                  auto_wait: bool = True,
-                 resizable: bool = True):
+                 resizable: bool = True,
+                 initial_geometry: Optional[str] = None):
         super().__init__(parent)
         
         self.title(title)
@@ -43,6 +44,10 @@ class BaseDialog(tk.Toplevel):
         # 应用主题
         self._apply_theme()
         
+        # 在创建控件前应用子类声明的尺寸，控件只需按最终尺寸布局一次
+        if initial_geometry:
+            self.geometry(initial_geometry)
+        
         # 创建内容
         self._create_widgets()
         
@@ -5,8 +5,10 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import functools
 import webbrowser
-from typing import Optional, Dict, List
+from collections import OrderedDict, defaultdict
+from typing import Optional, Dict, List, Tuple
 
 from .dialogs import BaseDialog
 from .translator import Translator
@@ -20,7 +22,164 @@ from features.teaching import (
 )
 
 
-class RulesHelpDialog(BaseDialog):
+# 不同规则的简要提示
+_HIGHLIGHTS: Dict[str, Tuple[str, ...]] = {
+    "chinese": (
+        "数子法：活子与空点都计入地盘",
+        "贴目常用 7.5 目",
+        "收官阶段可以随手填空",
+    ),
+    "japanese": (
+        "数目法：只数空与提子/死子",
+        "贴 6.5 目，需判定死活后再数目",
+        "连续两次虚手结束对局",
+    ),
+    "aga": (
+        "区域计分，接近中国规则",
+        "白方贴 7.5 目，每次虚手需交还一子",
+        "规则明确，比赛常用",
+    ),
+}
+
+_BULLET = "\n- "
+
+
+def _format_bullets(heading: str, items) -> str:
+    """生成“标题 + 列表项”文本，列表为空时返回空串"""
+    if not items:
+        return ""
+    return f"{heading}{_BULLET}{_BULLET.join(items)}"
+
+
+# 预先拼接好的提示文本，规则切换时直接追加
+_HIGHLIGHTS_RENDERED: Dict[str, str] = {
+    key: "\n\n" + _format_bullets("重点提示:", items)
+    for key, items in _HIGHLIGHTS.items()
+}
+
+# 选择事件防抖间隔（毫秒）
+_SELECT_DEBOUNCE_MS = 50
+
+# 教程对话框最多保留的课程视图数量
+_LESSON_VIEW_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_rules_tutorial() -> RulesTutorial:
+    """调用方未提供 RulesTutorial 时，整个进程共用同一个实例"""
+    return RulesTutorial()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_teaching_system_instance() -> TeachingSystem:
+    """调用方未提供 TeachingSystem 时，整个进程共用同一个实例（课程进度保存在其中）"""
+    return TeachingSystem(Translator())
+
+
+def _shared_teaching_system(language: str) -> TeachingSystem:
+    """取得共享的 TeachingSystem，并让其翻译器（课程界面文字会用到）切换到 language"""
+    teaching_system = _shared_teaching_system_instance()
+    translator = teaching_system.translator
+    if translator.language != language:
+        translator.set_language(language)
+    return teaching_system
+
+
+@functools.lru_cache(maxsize=1)
+def _get_browser() -> webbrowser.BaseBrowser:
+    """解析默认浏览器（仅首次解析，之后复用）"""
+    return webbrowser.get()
+
+
+class _TCache:
+    """带缓存的翻译查询，语言切换时自动清空缓存"""
+
+    def __init__(self, translator: Translator):
+        self._translator = translator
+        self._language = getattr(translator, "language", None)
+        self._get = functools.lru_cache(maxsize=256)(self._lookup)
+
+    def _lookup(self, key: str, default: Optional[str], kwargs: frozenset) -> str:
+        return self._translator.get(key, default, **dict(kwargs))
+
+    def __call__(self, key: str, default: Optional[str] = None, **kwargs) -> str:
+        language = getattr(self._translator, "language", None)
+        if language != self._language:
+            self._get.cache_clear()
+            self._language = language
+        return self._get(key, default, frozenset(kwargs.items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_rules(rules_tutorial: RulesTutorial, rule_key: str) -> str:
+    """规则正文加重点提示（内容与语言无关，跨对话框缓存）"""
+    content = rules_tutorial.get_rules_text(rule_key)
+    return content.strip() + _HIGHLIGHTS_RENDERED.get(rule_key, "")
+
+
+class _ExternalLinksMixin:
+    """为对话框提供打开外部链接的能力"""
+
+    def _build_link_list(self, parent) -> tk.Text:
+        """用单个只读 Text 控件展示 self._resources，每行一个可点击链接"""
+        text = tk.Text(
+            parent,
+            height=len(self._resources),
+            wrap="none",
+            cursor="hand2",
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            bg=self.theme.ui_background,
+            fg=self.theme.ui_text_primary,
+        )
+        text.insert("1.0", "\n".join(res["label"] for res in self._resources))
+        text.tag_add("link", "1.0", "end")
+        text.tag_config("link", foreground=self.theme.info_color, underline=True)
+        text.tag_bind("link", "<Button-1>", self._on_link_click)
+        text.configure(state="disabled")
+        return text
+
+    def _on_link_click(self, event):
+        """根据点击位置所在行打开对应资源"""
+        line = int(event.widget.index(f"@{event.x},{event.y}").split(".")[0])
+        if 1 <= line <= len(self._resources):
+            self._open_link(self._resources[line - 1]["url"])
+
+    def _open_link(self, url: str):
+        """在浏览器打开资源链接"""
+        try:
+            _get_browser().open(url, new=2)
+        except Exception as exc:  # pragma: no cover - UI 提示
+            messagebox.showerror(
+                self._t("error", "错误"),
+                f"无法打开链接: {exc}",
+                parent=self,
+            )
+
+
+class _DebouncedSelectMixin:
+    """合并快速连续的选择事件，只处理最后一次"""
+
+    _pending_after: Optional[str] = None
+
+    def _debounce(self, callback, *args):
+        if self._pending_after:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(_SELECT_DEBOUNCE_MS, self._run_debounced, callback, args)
+
+    def _run_debounced(self, callback, args):
+        self._pending_after = None
+        callback(*args)
+
+    def destroy(self):
+        if self._pending_after:
+            self.after_cancel(self._pending_after)
+            self._pending_after = None
+        super().destroy()
+
+
+class RulesHelpDialog(_DebouncedSelectMixin, _ExternalLinksMixin, BaseDialog):
     """规则说明对话框"""
 
     def __init__(
@@ -32,12 +191,13 @@ class RulesHelpDialog(BaseDialog):
         **kwargs,
     ):
         self.translator = translator or Translator()
+        self._t = _TCache(self.translator)
         self.theme = theme or Theme(name="default")
-        self.rules_tutorial = rules_tutorial or RulesTutorial()
+        self.rules_tutorial = rules_tutorial or _shared_rules_tutorial()
         self._rule_options = [
-            ("chinese", self.translator.get("chinese_rules", "中国规则")),
-            ("japanese", self.translator.get("japanese_rules", "日本规则")),
-            ("aga", self.translator.get("aga_rules", "AGA规则")),
+            ("chinese", self._t("chinese_rules", "中国规则")),
+            ("japanese", self._t("japanese_rules", "日本规则")),
+            ("aga", self._t("aga_rules", "AGA规则")),
         ]
         self._resources = [
             {
@@ -57,19 +217,15 @@ class RulesHelpDialog(BaseDialog):
                 "url": "https://senseis.xmp.net/?RulesOfGo",
             },
         ]
+        self._last_rule_key: Optional[str] = None
         super().__init__(
             parent,
-            title=self.translator.get("rules_help", "规则说明"),
+            title=self._t("rules_help", "规则说明"),
             translator=self.translator,
             theme=self.theme,
             modal=kwargs.get("modal", True),
-            auto_wait=False,
+            initial_geometry="760x580",
         )
-        # BaseDialog 会在 __init__ 结束时居中，此处再调整尺寸并手动等待
-        self.geometry("760x580")
-        self._center_window()
-        if self._modal:
-            self.wait_window()
 
     def _create_widgets(self):
         """创建规则说明内容"""
@@ -78,7 +234,7 @@ class RulesHelpDialog(BaseDialog):
 
         intro = ttk.Label(
             main_frame,
-            text=self.translator.get(
+            text=self._t(
                 "rules_description",
                 "不同规则在计分、劫争和贴目上略有差异，选择下方规则查看详情。",
             ),
@@ -93,40 +249,62 @@ class RulesHelpDialog(BaseDialog):
 
         ttk.Label(
             selection_frame,
-            text=self.translator.get("rules_type", "规则"),
+            text=self._t("rules_type", "规则"),
             style="Dialog.TLabel",
         ).pack(side="left")
 
         self.rule_var = tk.StringVar(value=self._rule_options[0][1])
-        rule_selector = ttk.Combobox(
+        self.rule_selector = ttk.Combobox(
             selection_frame,
             state="readonly",
             textvariable=self.rule_var,
             values=[label for _, label in self._rule_options],
             width=25,
         )
-        rule_selector.pack(side="left", padx=(8, 0))
-        rule_selector.current(0)
-        rule_selector.bind("<<ComboboxSelected>>", self._on_rule_change)
+        self.rule_selector.pack(side="left", padx=(8, 0))
+        self.rule_selector.current(0)
+        self.rule_selector.bind("<<ComboboxSelected>>", self._on_rule_change)
 
         content_frame = ttk.Frame(main_frame, style="Dialog.TFrame")
         content_frame.pack(fill="both", expand=True)
 
-        self.content_text = tk.Text(
+        # 只读规则文本：Canvas + Message，更新时直接替换文字，无需切换状态
+        self._content_canvas = tk.Canvas(
             content_frame,
-            wrap="word",
-            height=20,
             bg=self.theme.ui_panel_background,
-            fg=self.theme.ui_text_primary,
+            highlightthickness=0,
             relief="solid",
             borderwidth=1,
         )
-        self.content_text.pack(fill="both", expand=True, pady=(4, 6))
-        self.content_text.configure(state="disabled")
+        content_scrollbar = ttk.Scrollbar(
+            content_frame, orient="vertical", command=self._content_canvas.yview
+        )
+        self._content_canvas.configure(yscrollcommand=content_scrollbar.set)
+        content_scrollbar.pack(side="right", fill="y", pady=(4, 6))
+        self._content_canvas.pack(side="left", fill="both", expand=True, pady=(4, 6))
+
+        self.content_message = tk.Message(
+            self._content_canvas,
+            text="",
+            anchor="nw",
+            justify="left",
+            width=700,
+            bg=self.theme.ui_panel_background,
+            fg=self.theme.ui_text_primary,
+        )
+        self._content_window = self._content_canvas.create_window(
+            (4, 4), window=self.content_message, anchor="nw"
+        )
+        self.content_message.bind("<Configure>", self._on_content_message_configure)
+        self._content_canvas.bind("<Configure>", self._on_content_canvas_configure)
+        # 滚轮滚动：指针可能落在 Message 或画布空白处，两者都要绑定
+        for widget in (self._content_canvas, self.content_message):
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                widget.bind(sequence, self._on_content_mousewheel)
 
         resources = ttk.LabelFrame(
             main_frame,
-            text=self.translator.get("resources", "在线参考"),
+            text=self._t("resources", "在线参考"),
             padding=8,
             style="Dialog.TLabelframe",
         )
@@ -140,74 +318,54 @@ class RulesHelpDialog(BaseDialog):
             justify="left",
         ).pack(anchor="w", pady=(0, 6))
 
-        for resource in self._resources:
-            ttk.Button(
-                resources,
-                text=resource["label"],
-                command=lambda url=resource["url"]: self._open_link(url),
-            ).pack(anchor="w", pady=2)
+        self._build_link_list(resources).pack(fill="x")
 
         # 初始化显示
         self._update_rules_text(self._rule_options[0][0])
 
     def _on_rule_change(self, _event=None):
         """规则选择变更"""
-        rule_key = next(
-            (key for key, label in self._rule_options if label == self.rule_var.get()),
-            self._rule_options[0][0],
-        )
-        self._update_rules_text(rule_key)
+        self._debounce(self._apply_rule_change)
+
+    def _apply_rule_change(self):
+        # 按下标取规则，避免翻译后标签重名导致反查出错
+        index = self.rule_selector.current()
+        if index < 0:
+            index = 0
+        self._update_rules_text(self._rule_options[index][0])
 
     def _update_rules_text(self, rule_key: str):
         """更新规则文本显示"""
-        content = self.rules_tutorial.get_rules_text(rule_key)
-        highlights = self._build_highlights(rule_key)
-        self.content_text.configure(state="normal")
-        self.content_text.delete("1.0", "end")
-        self.content_text.insert("end", content.strip())
-        if highlights:
-            self.content_text.insert(
-                "end",
-                "\n\n重点提示:\n- " + "\n- ".join(highlights),
-            )
-        self.content_text.configure(state="disabled")
-
-    def _build_highlights(self, rule_key: str) -> List[str]:
-        """不同规则的简要提示"""
-        hints: Dict[str, List[str]] = {
-            "chinese": [
-                "数子法：活子与空点都计入地盘",
-                "贴目常用 7.5 目",
-                "收官阶段可以随手填空",
-            ],
-            "japanese": [
-                "数目法：只数空与提子/死子",
-                "贴 6.5 目，需判定死活后再数目",
-                "连续两次虚手结束对局",
-            ],
-            "aga": [
-                "区域计分，接近中国规则",
-                "白方贴 7.5 目，每次虚手需交还一子",
-                "规则明确，比赛常用",
-            ],
-        }
-        return hints.get(rule_key, [])
+        if rule_key == self._last_rule_key:
+            return
+        self._last_rule_key = rule_key
+        self.content_message.configure(text=_render_rules(self.rules_tutorial, rule_key))
+        self._content_canvas.yview_moveto(0)
+
+    def _on_content_message_configure(self, _event=None):
+        self._content_canvas.configure(scrollregion=self._content_canvas.bbox("all"))
+
+    def _on_content_mousewheel(self, event):
+        # Windows/macOS 使用 delta，X11 使用 Button-4/5
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self._content_canvas.yview_scroll(step, "units")
+        return "break"
 
-    def _open_link(self, url: str):
-        """在浏览器打开资源链接"""
-        try:
-            webbrowser.open(url, new=2)
-        except Exception as exc:  # pragma: no cover - UI 提示
-            messagebox.showerror(
-                self.translator.get("error", "错误"),
-                f"无法打开链接: {exc}",
-                parent=self,
-            )
+    def _on_content_canvas_configure(self, event):
+        self.content_message.configure(width=max(event.width - 12, 100))
 
 
-class TutorialDialog(BaseDialog):
+class TutorialDialog(_DebouncedSelectMixin, _ExternalLinksMixin, BaseDialog):
     """教程对话框"""
 
+    # 课程类型标签，按语言缓存，所有教程对话框共用
+    _TYPE_LABEL_CACHE: Dict[str, Dict[LessonType, str]] = {}
+
     def __init__(
         self,
         parent,
@@ -217,17 +375,11 @@ class TutorialDialog(BaseDialog):
         **kwargs,
     ):
         self.translator = translator or Translator()
+        self._language = getattr(self.translator, "language", "zh")
+        self._t = _TCache(self.translator)
         self.theme = theme or Theme(name="default")
-        self.teaching_system = teaching_system or TeachingSystem()
-        self._type_labels: Dict[LessonType, str] = {
-            LessonType.RULES: self.translator.get("rules", "规则"),
-            LessonType.BASICS: self.translator.get("tutorial", "教程") + "·基础",
-            LessonType.TACTICS: "战术训练",
-            LessonType.STRATEGY: "战略思路",
-            LessonType.LIFE_DEATH: "死活",
-            LessonType.TESUJI: "手筋",
-            LessonType.ENDGAME: "官子",
-        }
+        self.teaching_system = teaching_system or _shared_teaching_system(self._language)
+        self._type_labels = self._get_type_labels()
         self._resources = [
             {
                 "label": "在线围棋入门（OGS）",
@@ -242,18 +394,23 @@ class TutorialDialog(BaseDialog):
                 "url": "https://senseis.xmp.net/?BeginnerExercises",
             },
         ]
+        self._meta_template = "{type_label} | 预计 {mins} 分钟 | 先修: {prereq}"
+        self._stats_template = (
+            "已完成课程: {lessons_completed}/{lessons_total} | "
+            "棋题解决: {puzzles_solved} | 总积分: {total_score}"
+        )
+        self._last_displayed_id: Optional[str] = None
+        self._prereq_title_cache: Dict[str, str] = {}
+        self._lesson_meta_cache: Dict[str, str] = {}
+        self._lesson_cache_version: Optional[int] = None
         super().__init__(
             parent,
-            title=self.translator.get("tutorial", "教程"),
+            title=self._t("tutorial", "教程"),
             translator=self.translator,
             theme=self.theme,
             modal=kwargs.get("modal", True),
-            auto_wait=False,
+            initial_geometry="960x640",
         )
-        self.geometry("960x640")
-        self._center_window()
-        if self._modal:
-            self.wait_window()
 
     def _create_widgets(self):
         """创建教程浏览界面"""
@@ -284,6 +441,7 @@ class TutorialDialog(BaseDialog):
         self.lesson_tree = ttk.Treeview(tree_frame, show="tree")
         self.lesson_tree.pack(fill="both", expand=True)
         self.lesson_tree.bind("<<TreeviewSelect>>", self._on_lesson_selected)
+        self.lesson_tree.bind("<<TreeviewOpen>>", self._on_type_expand)
 
         self.stats_label = ttk.Label(
             left, text="", style="Dialog.TLabel", wraplength=220, justify="left"
@@ -299,40 +457,38 @@ class TutorialDialog(BaseDialog):
         )
         overview.pack(fill="x")
 
-        self.lesson_title = ttk.Label(
-            overview, text="", font=("Arial", 13, "bold"), style="Dialog.TLabel"
-        )
-        self.lesson_title.pack(anchor="w")
-
-        self.lesson_meta = ttk.Label(
-            overview, text="", style="Dialog.TLabel", wraplength=640, justify="left"
-        )
-        self.lesson_meta.pack(anchor="w", pady=2)
-
-        self.lesson_desc = ttk.Label(
-            overview, text="", style="Dialog.TLabel", wraplength=640, justify="left"
-        )
-        self.lesson_desc.pack(anchor="w", pady=(4, 0))
-
-        self.objectives_label = ttk.Label(
+        # 标题、概要、简介与学习目标合并到一个只读 Text 中，切换课程时整体替换
+        self.overview_text = tk.Text(
             overview,
-            text="",
-            style="Dialog.TLabel",
-            wraplength=640,
-            justify="left",
+            height=8,
+            wrap="word",
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            bg=self.theme.ui_background,
+            fg=self.theme.ui_text_primary,
+        )
+        self.overview_text.tag_configure(
+            "title", font=("Arial", 13, "bold"), spacing3=2
         )
-        self.objectives_label.pack(anchor="w", pady=(4, 0))
+        self.overview_text.tag_configure("meta", spacing3=4)
+        self.overview_text.tag_configure("desc", spacing3=4)
+        self.overview_text.tag_configure("objectives")
+        self.overview_text.pack(fill="x")
+        self.overview_text.configure(state="disabled")
 
         lesson_frame = ttk.LabelFrame(
             right,
-            text=self.translator.get("tutorial", "教程"),
+            text=self._t("tutorial", "教程"),
             padding=6,
             style="Dialog.TLabelframe",
         )
         lesson_frame.pack(fill="both", expand=True, pady=(8, 0))
 
-        self.lesson_view = InteractiveLesson(lesson_frame, self.teaching_system)
-        self.lesson_view.pack(fill="both", expand=True)
+        # 每个课程对应一个 InteractiveLesson，按最近使用缓存，切回时无需重新加载
+        self._lesson_frame = lesson_frame
+        self._lesson_views: "OrderedDict[str, InteractiveLesson]" = OrderedDict()
+        self.lesson_view: Optional[InteractiveLesson] = None
 
         resource_frame = ttk.LabelFrame(
             right, text="推荐阅读", padding=8, style="Dialog.TLabelframe"
@@ -347,40 +503,83 @@ class TutorialDialog(BaseDialog):
             justify="left",
         ).pack(anchor="w", pady=(0, 6))
 
-        for res in self._resources:
-            ttk.Button(
-                resource_frame,
-                text=res["label"],
-                command=lambda url=res["url"]: self._open_link(url),
-            ).pack(anchor="w", pady=2)
+        self._build_link_list(resource_frame).pack(fill="x")
 
         self._populate_tree()
         self._update_stats()
 
+    def _get_type_labels(self) -> Dict[LessonType, str]:
+        labels = self._TYPE_LABEL_CACHE.get(self._language)
+        if labels is None:
+            labels = self._TYPE_LABEL_CACHE[self._language] = {
+                LessonType.RULES: self._t("rules", "规则"),
+                LessonType.BASICS: self._t("tutorial", "教程") + "·基础",
+                LessonType.TACTICS: "战术训练",
+                LessonType.STRATEGY: "战略思路",
+                LessonType.LIFE_DEATH: "死活",
+                LessonType.TESUJI: "手筋",
+                LessonType.ENDGAME: "官子",
+            }
+        return labels
+
     def _populate_tree(self):
-        """填充课程树"""
-        type_nodes: Dict[LessonType, str] = {}
-        for lesson in sorted(
-            self.teaching_system.lessons.values(), key=lambda l: l.difficulty.value
-        ):
-            parent = type_nodes.get(lesson.type)
-            if not parent:
-                parent = self.lesson_tree.insert(
-                    "",
-                    "end",
-                    text=self._type_labels.get(lesson.type, lesson.type.value),
-                    open=True,
-                )
-                type_nodes[lesson.type] = parent
-            self.lesson_tree.insert(parent, "end", iid=lesson.id, text=lesson.title)
+        """填充课程树（只插入类型节点，课程在展开时再加载）"""
+        buckets: Dict[LessonType, List[Lesson]] = defaultdict(list)
+        for lesson in self.teaching_system.get_sorted_lessons():
+            buckets[lesson.type].append(lesson)
+
+        self._type_buckets: Dict[LessonType, List[Lesson]] = {}
+        self._type_parents: Dict[LessonType, str] = {}
+        self._parent_types: Dict[str, LessonType] = {}
+        self._type_populated: Dict[LessonType, bool] = {}
+        for lesson_type in LessonType:
+            bucket = buckets.get(lesson_type)
+            if not bucket:
+                continue
+            parent = self.lesson_tree.insert(
+                "",
+                "end",
+                text=self._type_labels.get(lesson_type, lesson_type.value),
+                open=False,
+            )
+            # 占位子节点，保证展开箭头可见
+            self.lesson_tree.insert(parent, "end", text="…")
+            self._type_buckets[lesson_type] = bucket
+            self._type_parents[lesson_type] = parent
+            self._parent_types[parent] = lesson_type
+            self._type_populated[lesson_type] = False
 
         # 默认选择基础规则课程
-        if "rules_basic" in self.teaching_system.lessons:
-            self.lesson_tree.selection_set("rules_basic")
-            self._display_lesson(self.teaching_system.lessons["rules_basic"])
+        default_lesson = self.teaching_system.lessons.get("rules_basic")
+        if default_lesson:
+            self._expand_type(default_lesson.type)
+            self.lesson_tree.selection_set(default_lesson.id)
+            self._display_lesson(default_lesson)
+
+    def _on_type_expand(self, _event=None):
+        """展开类型节点时加载其课程"""
+        lesson_type = self._parent_types.get(self.lesson_tree.focus())
+        if lesson_type is not None:
+            self._fill_type(lesson_type)
+
+    def _expand_type(self, lesson_type: LessonType):
+        self._fill_type(lesson_type)
+        self.lesson_tree.item(self._type_parents[lesson_type], open=True)
+
+    def _fill_type(self, lesson_type: LessonType):
+        if self._type_populated.get(lesson_type, True):
+            return
+        self._type_populated[lesson_type] = True
+        parent = self._type_parents[lesson_type]
+        self.lesson_tree.delete(*self.lesson_tree.get_children(parent))
+        for lesson in self._type_buckets[lesson_type]:
+            self.lesson_tree.insert(parent, "end", iid=lesson.id, text=lesson.title)
 
     def _on_lesson_selected(self, _event=None):
         """选择课程"""
+        self._debounce(self._apply_lesson_selection)
+
+    def _apply_lesson_selection(self):
         selection = self.lesson_tree.selection()
         if not selection:
             return
@@ -391,51 +590,113 @@ class TutorialDialog(BaseDialog):
 
     def _display_lesson(self, lesson: Lesson):
         """展示课程详情并加载内容"""
-        prereq_titles = self._format_prerequisites(lesson.prerequisites)
-        prereq = "先修: " + ("、".join(prereq_titles) if prereq_titles else "无")
-        meta = f"{self._type_labels.get(lesson.type, lesson.type.value)} | 预计 {lesson.estimated_time} 分钟 | {prereq}"
-        self.lesson_title.config(text=lesson.title)
-        self.lesson_meta.config(text=meta)
-        self.lesson_desc.config(text=lesson.description)
-        if lesson.objectives:
-            obj_text = "学习目标:\n- " + "\n- ".join(lesson.objectives)
-        else:
-            obj_text = ""
-        self.objectives_label.config(text=obj_text)
+        # 重复选中同一课程（包括程序设置选中）时无需重新渲染
+        if lesson.id == self._last_displayed_id:
+            return
+        self._last_displayed_id = lesson.id
+        self._ensure_lesson_caches()
+        meta = self._lesson_meta_cache.get(lesson.id)
+        if meta is None:
+            meta = self._format_meta(lesson, self._format_prerequisites(lesson))
+        segments = [
+            lesson.title, "title", "\n", (),
+            meta, "meta", "\n", (),
+            lesson.description, "desc",
+        ]
+        objectives = _format_bullets("学习目标:", lesson.objectives)
+        if objectives:
+            segments += ["\n", (), objectives, "objectives"]
+        self.overview_text.configure(state="normal")
+        self.overview_text.delete("1.0", "end")
+        self.overview_text.insert("end", *segments)
+        self.overview_text.configure(state="disabled")
+
+        self._show_lesson_view(lesson.id)
+        self._update_stats()
+
+    def _show_lesson_view(self, lesson_id: str):
+        """切换到课程对应的互动视图，命中缓存时直接复用"""
+        view = self._lesson_views.get(lesson_id)
+        if view is not None:
+            self._lesson_views.move_to_end(lesson_id)
+            # 复用视图时不再调用 load_lesson，需同步当前课程进度
+            self.teaching_system.start_lesson(lesson_id)
+            if view is not self.lesson_view:
+                if self.lesson_view is not None:
+                    self.lesson_view.pack_forget()
+                view.pack(fill="both", expand=True)
+                self.lesson_view = view
+            return
 
-        # 加载互动内容（允许预览，先修未完成时仍提示）
+        if self.lesson_view is not None:
+            self.lesson_view.pack_forget()
+        view = InteractiveLesson(self._lesson_frame, self.teaching_system)
+        view.pack(fill="both", expand=True)
+        self.lesson_view = view
+
+        # 加载互动内容（允许预览，先修未完成时仍提示）；失败的视图不缓存，下次重新加载
         try:
-            self.lesson_view.load_lesson(lesson.id)
+            view.load_lesson(lesson_id)
         except Exception:
+            view.destroy()
+            self.lesson_view = None
             messagebox.showwarning(
-                self.translator.get("warning", "警告"),
+                self._t("warning", "警告"),
                 "无法加载课程内容，请稍后再试。",
                 parent=self,
             )
-        self._update_stats()
+            return
+        # 课程不存在或先修未完成时 load_lesson 只弹出提示并返回，视图保持空白；
+        # 只有 start_lesson 成功才会把它记为当前课程
+        progress = getattr(self.teaching_system, "user_progress", {})
+        if view.current_lesson is None or progress.get("current_lesson") != lesson_id:
+            view.destroy()
+            self.lesson_view = None
+            return
 
-    def _format_prerequisites(self, prereqs: List[str]) -> List[str]:
+        self._lesson_views[lesson_id] = view
+        while len(self._lesson_views) > _LESSON_VIEW_CACHE_SIZE:
+            _, evicted = self._lesson_views.popitem(last=False)
+            evicted.destroy()
+
+    def _ensure_lesson_caches(self):
+        """一次性生成各课程的先修标题与概要文本，课程列表变化后重建"""
+        version = getattr(self.teaching_system, "lessons_version", 0)
+        if version == self._lesson_cache_version:
+            return
+        lessons = self.teaching_system.lessons
+        self._prereq_title_cache = {}
+        self._lesson_meta_cache = {}
+        for lesson in lessons.values():
+            titles = "、".join(
+                lessons[pid].title if pid in lessons else pid
+                for pid in lesson.prerequisites
+            )
+            self._prereq_title_cache[lesson.id] = titles
+            self._lesson_meta_cache[lesson.id] = self._format_meta(lesson, titles)
+        self._lesson_cache_version = version
+
+    def _format_meta(self, lesson: Lesson, prereq_titles: str) -> str:
+        return self._meta_template.format_map(
+            {
+                "type_label": self._type_labels[lesson.type],
+                "mins": lesson.estimated_time,
+                "prereq": prereq_titles or "无",
+            }
+        )
+
+    def _format_prerequisites(self, lesson: Lesson) -> str:
         """将先修课程ID转换为标题"""
-        titles: List[str] = []
-        for pid in prereqs:
-            lesson = self.teaching_system.get_lesson(pid)
-            titles.append(lesson.title if lesson else pid)
+        self._ensure_lesson_caches()
+        titles = self._prereq_title_cache.get(lesson.id)
+        if titles is None:
+            titles = "、".join(
+                getattr(self.teaching_system.get_lesson(pid), "title", pid)
+                for pid in lesson.prerequisites
+            )
         return titles
 
     def _update_stats(self):
         """更新统计信息"""
         stats = self.teaching_system.get_user_statistics()
-        self.stats_label.config(
-            text=f"已完成课程: {stats['lessons_completed']}/{stats['lessons_total']} | 棋题解决: {stats['puzzles_solved']} | 总积分: {stats['total_score']}"
-        )
-
-    def _open_link(self, url: str):
-        """打开外部教程链接"""
-        try:
-            webbrowser.open(url, new=2)
-        except Exception as exc:  # pragma: no cover - UI 提示
-            messagebox.showerror(
-                self.translator.get("error", "错误"),
-                f"无法打开链接: {exc}",
-                parent=self,
-            )
+        self.stats_label.config(text=self._stats_template.format_map(stats))
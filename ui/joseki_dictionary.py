@@ -4,9 +4,10 @@ Joseki dictionary window.
 
 from __future__ import annotations
 
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import webbrowser
 from urllib.parse import quote_plus
 
@@ -16,6 +17,16 @@ from ui.translator import Translator
 from ui.themes import Theme
 
 
+_SEARCH_DEBOUNCE_MS = 150
+_LIST_PAGE_SIZE = 200
+_STAR_MARKS = tuple("\u2605" * i for i in range(11))
+
+
+@lru_cache(maxsize=64)
+def _build_url(base: str, query: str) -> str:
+    return base + quote_plus(query)
+
+
 class JosekiDictionaryWindow(tk.Toplevel):
     """Joseki dictionary window with search and preview."""
 
@@ -41,7 +52,34 @@ class JosekiDictionaryWindow(tk.Toplevel):
         self.current_joseki: Optional[JosekiSequence] = None
         self.current_move_index = 0
         self._list_items: List[JosekiSequence] = []
+        self._list_rendered = 0
+        self._page_after_id: Optional[str] = None
+        self._cached_base_url: Optional[str] = None
+        self._cached_url_lang: Optional[str] = None
         self._web_search_keyword: Optional[str] = None
+        self._type_mapping_cache: Dict[str, Dict[JosekiType, str]] = {}
+        self._lang_dict: Dict[str, str] = {}
+        self._en_dict: Dict[str, str] = {}
+        self._translation_lang: Optional[str] = None
+        self._translation_source: Optional[Dict[str, Dict[str, str]]] = None
+        self._main_line_cache: Dict[int, List[JosekiMove]] = {}
+        # Board state kept between renders so Next/Prev only touch one stone.
+        self._board_state: List[List[str]] = []
+        self._move_numbers: Dict[Tuple[int, int], int] = {}
+        self._rendered_points: List[Optional[Tuple[int, int]]] = []
+        self._rendered_joseki_id: Optional[int] = None
+        self._rendered_region: Optional[Tuple[int, int, int]] = None
+        self._last_preview_params: Optional[Tuple[int, int, int]] = None
+        self._preview_region_cache: Dict[int, Tuple[int, int, int]] = {}
+        self._search_after_id: Optional[str] = None
+        self._last_keyword: Optional[str] = ""
+        self._last_results: Optional[List[JosekiSequence]] = None
+        self._search_index: Dict[int, str] = {}
+        self._qgram_index: Dict[int, FrozenSet[str]] = {}
+        self._postings: Dict[str, FrozenSet[int]] = {}
+        self._search_index_lang: Optional[str] = None
+        self._by_popularity: Tuple[JosekiSequence, ...] = ()
+        self._sort_by_popularity()
 
         self.title(self.translator.get("joseki_dictionary"))
         self.geometry("1040x720")
@@ -52,22 +90,29 @@ class JosekiDictionaryWindow(tk.Toplevel):
         self._load_list()
 
     def _create_widgets(self, show_coordinates: bool, show_move_numbers: bool) -> None:
+        get = self.translator.get
+        labels = {
+            key: get(key)
+            for key in ("search", "joseki_list", "joseki_info", "board_preview", "comment")
+        }
+
         container = ttk.Frame(self)
         container.pack(fill="both", expand=True, padx=10, pady=10)
 
         search_frame = ttk.Frame(container)
         search_frame.pack(fill="x", pady=(0, 8))
 
-        ttk.Label(search_frame, text=self.translator.get("search")).pack(side="left")
+        ttk.Label(search_frame, text=labels["search"]).pack(side="left")
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.pack(side="left", fill="x", expand=True, padx=6)
-        self.search_entry.bind("<Return>", lambda _e: self._on_search())
+        self.search_entry.bind("<Return>", lambda _e: self._submit_search())
+        self.search_entry.bind("<KeyRelease>", lambda _e: self._on_search())
 
         ttk.Button(
             search_frame,
-            text=self.translator.get("search"),
-            command=self._on_search,
+            text=labels["search"],
+            command=self._submit_search,
         ).pack(side="left")
 
         paned = ttk.PanedWindow(container, orient=tk.HORIZONTAL)
@@ -76,13 +121,14 @@ class JosekiDictionaryWindow(tk.Toplevel):
         left = ttk.Frame(paned)
         paned.add(left, weight=1)
 
-        list_frame = ttk.LabelFrame(left, text=self.translator.get("joseki_list"))
+        list_frame = ttk.LabelFrame(left, text=labels["joseki_list"])
         list_frame.pack(fill="both", expand=True)
 
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical")
+        self._list_scrollbar = scrollbar
         self.joseki_listbox = tk.Listbox(
             list_frame,
-            yscrollcommand=scrollbar.set,
+            yscrollcommand=self._on_list_scroll,
             exportselection=False,
         )
         scrollbar.config(command=self.joseki_listbox.yview)
@@ -94,28 +140,18 @@ class JosekiDictionaryWindow(tk.Toplevel):
         right = ttk.Frame(paned)
         paned.add(right, weight=2)
 
-        info_frame = ttk.LabelFrame(right, text=self.translator.get("joseki_info"))
+        info_frame = ttk.LabelFrame(right, text=labels["joseki_info"])
         info_frame.pack(fill="x", pady=(0, 6))
         self.info_text = tk.Text(info_frame, height=6, wrap="word")
         self.info_text.pack(fill="both", expand=True, padx=6, pady=6)
 
-        board_frame = ttk.LabelFrame(right, text=self.translator.get("board_preview"))
+        board_frame = ttk.LabelFrame(right, text=labels["board_preview"])
         board_frame.pack(fill="both", expand=True, pady=(0, 6))
 
-        self.board_canvas = BoardCanvas(
-            board_frame,
-            board_size=self.full_board_size,
-            theme=self.theme,
-            show_coordinates=show_coordinates,
-        )
-        self.board_canvas.pack(fill="both", expand=True, padx=6, pady=6)
-        self.board_canvas.set_show_move_numbers(show_move_numbers)
-        self.board_canvas.unbind("<Button-1>")
-        self.board_canvas.unbind("<Button-3>")
-        self.board_canvas.unbind("<Motion>")
-        self.board_canvas.on_click = None
-        self.board_canvas.on_hover = None
-        self.board_canvas.on_right_click = None
+        # The preview canvas is built on first selection; see _ensure_board_canvas.
+        self._board_frame = board_frame
+        self._board_options = (show_coordinates, show_move_numbers)
+        self.board_canvas: Optional[BoardCanvas] = None
 
         control_frame = ttk.Frame(right)
         control_frame.pack(fill="x")
@@ -136,13 +172,33 @@ class JosekiDictionaryWindow(tk.Toplevel):
         self.move_label = ttk.Label(control_frame, text="0 / 0")
         self.move_label.pack(side="left", padx=10)
 
-        comment_frame = ttk.LabelFrame(right, text=self.translator.get("comment"))
+        comment_frame = ttk.LabelFrame(right, text=labels["comment"])
         comment_frame.pack(fill="both", expand=True, pady=(6, 0))
         self.comment_text = tk.Text(comment_frame, height=5, wrap="word")
         self.comment_text.pack(fill="both", expand=True, padx=6, pady=6)
         self._set_text(self.info_text, "")
         self._set_text(self.comment_text, "")
 
+    def refresh(self) -> None:
+        """Reload the list after the joseki database has been modified."""
+        self._sort_by_popularity()
+        self._main_line_cache.clear()
+        self._preview_region_cache.clear()
+        self._search_index.clear()
+        self._qgram_index.clear()
+        self._postings.clear()
+        self._invalidate_rendered_board()
+        self._last_keyword = ""
+        self._last_results = None
+        self.search_var.set("")
+        self._load_list()
+
+    def _sort_by_popularity(self) -> None:
+        # Candidates are scanned in this order, so search results need no sort.
+        self._by_popularity = tuple(
+            sorted(self.database.joseki_dict.values(), key=lambda item: -item.popularity)
+        )
+
     def _set_text(self, widget: tk.Text, text: str) -> None:
         widget.configure(state="normal")
         widget.delete("1.0", "end")
@@ -150,58 +206,123 @@ class JosekiDictionaryWindow(tk.Toplevel):
         widget.configure(state="disabled")
 
     def _load_list(self, joseki_list: Optional[List[JosekiSequence]] = None) -> None:
-        self.joseki_listbox.delete(0, "end")
+        self._cancel_list_page()
+        if self.joseki_listbox.size():
+            self.joseki_listbox.delete(0, "end")
         self._list_items = []
         self._web_search_keyword = None
         self.current_joseki = None
         self.current_move_index = 0
         self._set_text(self.info_text, "")
         self._set_text(self.comment_text, "")
-        if self.board_canvas.board_size != self.full_board_size:
-            self.board_canvas.set_board_size(self.full_board_size)
-        self.board_canvas.set_coordinate_mapping(0, 0, self.full_board_size, refresh=False)
-        self.board_canvas.clear_board()
+        self._reset_board_preview()
         self.move_label.config(text="0 / 0")
 
         items = joseki_list or self.database.search_joseki()
-        for joseki in items:
-            display_name = self._localize_joseki_name(joseki)
-            display = f"{display_name} ({joseki.popularity}%)"
-            self.joseki_listbox.insert("end", display)
-            self._list_items.append(joseki)
+        self._list_items = list(items)
+        self._list_rendered = 0
+        self._append_list_page()
 
         if not items:
             self._set_text(self.info_text, self.translator.get("no_results"))
 
+    def _append_list_page(self) -> None:
+        """Insert the next page of ``_list_items`` into the Listbox."""
+        self._page_after_id = None
+        page = self._list_items[self._list_rendered : self._list_rendered + _LIST_PAGE_SIZE]
+        if not page:
+            return
+        localize = self._localize_joseki_name
+        display = "{} ({}%)".format
+        displays = [display(localize(joseki), joseki.popularity) for joseki in page]
+        self.joseki_listbox.insert("end", *displays)
+        self._list_rendered += len(page)
+
+    def _on_list_scroll(self, first: str, last: str) -> None:
+        self._list_scrollbar.set(first, last)
+        # Rows are only materialized once the view nears the end of what is inserted.
+        if (
+            self._page_after_id is None
+            and float(last) >= 0.9
+            and self._list_rendered < len(self._list_items)
+        ):
+            self._page_after_id = self.after_idle(self._append_list_page)
+
+    def _cancel_list_page(self) -> None:
+        if self._page_after_id is not None:
+            self.after_cancel(self._page_after_id)
+            self._page_after_id = None
+
     def _on_search(self) -> None:
+        """Schedule a search; bursts of keystrokes collapse into one run."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(_SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _submit_search(self) -> None:
+        """Explicit Search/Enter: run now, even if the keyword has not changed."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._run_search(force=True)
+
+    def _run_search(self, force: bool = False) -> None:
+        self._search_after_id = None
+        # Drop caches built for another language before anything reads them.
+        self._sync_search_cache_language()
         keyword = self.search_var.get().strip()
+        lowered = keyword.lower()
+        if lowered == self._last_keyword and not force:
+            return
+
         if not keyword:
+            self._last_keyword = ""
+            self._last_results = None
             self._load_list()
             return
 
-        results = []
-        lowered = keyword.lower()
-        for joseki in self.database.joseki_dict.values():
-            if self._matches_keyword(joseki, lowered):
-                results.append(joseki)
-        results.sort(key=lambda item: item.popularity, reverse=True)
+        # Extending the previous keyword can only narrow its results.
+        if (
+            not force
+            and self._last_keyword
+            and self._last_results is not None
+            and lowered.startswith(self._last_keyword)
+        ):
+            candidates = self._last_results
+        else:
+            candidates = self._by_popularity
+
+        tokens = lowered.split()
+        if len(tokens) > 1:
+            # Multi-word queries match joseki containing every word.
+            matched = frozenset.intersection(*(self._token_postings(t) for t in tokens))
+            results = [joseki for joseki in candidates if id(joseki) in matched]
+        else:
+            results = self._filter_by_substring(candidates, lowered)
+        self._last_keyword = lowered
+        self._last_results = results
         if results:
             self._load_list(results)
             return
 
+        self._cancel_list_page()
         self.joseki_listbox.delete(0, "end")
         self._list_items = []
+        self._list_rendered = 0
         self._web_search_keyword = keyword
         label = f"{self.translator.get('search_web')}: {keyword}"
         self.joseki_listbox.insert("end", label)
         self._set_text(self.info_text, self.translator.get("no_results"))
         self._set_text(self.comment_text, "")
-        if self.board_canvas.board_size != self.full_board_size:
-            self.board_canvas.set_board_size(self.full_board_size)
-        self.board_canvas.set_coordinate_mapping(0, 0, self.full_board_size, refresh=False)
-        self.board_canvas.clear_board()
+        self._reset_board_preview()
         self.move_label.config(text="0 / 0")
 
+    def destroy(self) -> None:
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._cancel_list_page()
+        super().destroy()
+
     def _on_select(self, _event=None) -> None:
         selection = self.joseki_listbox.curselection()
         if not selection:
@@ -227,8 +348,8 @@ class JosekiDictionaryWindow(tk.Toplevel):
         joseki_type = self._format_joseki_type(self.current_joseki.type)
         joseki_name = self._localize_joseki_name(self.current_joseki)
         joseki_result = self._localize_result(self.current_joseki)
-        star = "\u2605"
-        difficulty_marks = star * max(0, int(self.current_joseki.difficulty))
+        difficulty = max(0, min(len(_STAR_MARKS) - 1, int(self.current_joseki.difficulty)))
+        difficulty_marks = _STAR_MARKS[difficulty]
         info = [
             f"{self.translator.get('name')}: {joseki_name}",
             f"{self.translator.get('type')}: {joseki_type}",
@@ -238,10 +359,12 @@ class JosekiDictionaryWindow(tk.Toplevel):
         ]
         self._set_text(self.info_text, "\n".join(info))
 
-        main_line = self.current_joseki.get_main_line()
+        main_line = self._get_main_line()
         if not main_line:
             self.move_label.config(text="0 / 0")
-            self.board_canvas.clear_board()
+            self._invalidate_rendered_board()
+            if self.board_canvas is not None:
+                self.board_canvas.clear_board()
             return
 
         self.current_move_index = max(0, min(self.current_move_index, len(main_line) - 1))
@@ -258,44 +381,153 @@ class JosekiDictionaryWindow(tk.Toplevel):
         self._render_board(main_line[: self.current_move_index + 1])
 
     def _render_board(self, moves: List) -> None:
+        self._ensure_board_canvas()
         if not moves:
-            if self.board_canvas.board_size != self.full_board_size:
-                self.board_canvas.set_board_size(self.full_board_size)
-            self.board_canvas.set_coordinate_mapping(0, 0, self.full_board_size, refresh=False)
-            self.board_canvas.clear_board()
+            self._reset_board_preview()
             return
 
-        region_moves = moves
-        if self.current_joseki:
-            region_moves = self.current_joseki.get_main_line() or moves
-        preview_size, offset_x, offset_y = self._calculate_preview_region(region_moves)
-        if preview_size != self.board_canvas.board_size:
-            self.board_canvas.set_board_size(preview_size, reset_coord=False)
-        self.board_canvas.set_coordinate_mapping(
-            offset_x,
-            offset_y,
-            self.full_board_size,
-            refresh=False,
+        if self.current_joseki and self._get_main_line():
+            preview_size, offset_x, offset_y = self._get_preview_region()
+        else:
+            preview_size, offset_x, offset_y = self._calculate_preview_region(moves)
+        region = (preview_size, offset_x, offset_y)
+        # Same crop as the last render: grid, stars and coordinates are still valid.
+        stones_only = region == self._last_preview_params
+        if not stones_only:
+            if preview_size != self.board_canvas.board_size:
+                self.board_canvas.set_board_size(preview_size, reset_coord=False)
+            self.board_canvas.set_coordinate_mapping(
+                offset_x,
+                offset_y,
+                self.full_board_size,
+                refresh=False,
+            )
+
+        if not self._update_board_incrementally(moves, region):
+            self._rebuild_board(moves, region)
+
+        # The canvas clears its state in place, so it gets copies, not aliases.
+        self.board_canvas.board_state = [row[:] for row in self._board_state]
+        self.board_canvas.move_numbers = dict(self._move_numbers)
+        self.board_canvas.last_move = next(
+            (point for point in reversed(self._rendered_points) if point), None
         )
+        self.board_canvas._hint_pos = None
+        if stones_only:
+            self.board_canvas.refresh_stones()
+        else:
+            self.board_canvas.delete("hint")
+            self.board_canvas.refresh()
+            self._last_preview_params = region
+
+    def _ensure_board_canvas(self) -> BoardCanvas:
+        if self.board_canvas is None:
+            show_coordinates, show_move_numbers = self._board_options
+            canvas = BoardCanvas(
+                self._board_frame,
+                board_size=self.full_board_size,
+                theme=self.theme,
+                show_coordinates=show_coordinates,
+            )
+            canvas.pack(fill="both", expand=True, padx=6, pady=6)
+            canvas.set_show_move_numbers(show_move_numbers)
+            canvas.unbind("<Button-1>")
+            canvas.unbind("<Button-3>")
+            canvas.unbind("<Motion>")
+            canvas.on_click = None
+            canvas.on_hover = None
+            canvas.on_right_click = None
+            self.board_canvas = canvas
+        return self.board_canvas
+
+    def _invalidate_rendered_board(self) -> None:
+        """Force the next render to rebuild the board instead of stepping it."""
+        self._rendered_joseki_id = None
+        self._rendered_region = None
+        self._last_preview_params = None
+
+    def _reset_board_preview(self) -> None:
+        self._invalidate_rendered_board()
+        if self.board_canvas is None:
+            return
+        if self.board_canvas.board_size != self.full_board_size:
+            self.board_canvas.set_board_size(self.full_board_size)
+        self.board_canvas.set_coordinate_mapping(0, 0, self.full_board_size, refresh=False)
+        self.board_canvas.clear_board()
 
-        board_state = [["" for _ in range(preview_size)] for _ in range(preview_size)]
-        move_numbers = {}
-        last_move = None
-
+    def _region_point(
+        self, move: JosekiMove, region: Tuple[int, int, int]
+    ) -> Optional[Tuple[int, int]]:
+        preview_size, offset_x, offset_y = region
+        nx = move.x - offset_x
+        ny = move.y - offset_y
+        if 0 <= nx < preview_size and 0 <= ny < preview_size:
+            return nx, ny
+        return None
+
+    def _rebuild_board(self, moves: List, region: Tuple[int, int, int]) -> None:
+        preview_size = region[0]
+        self._board_state = [[""] * preview_size for _ in range(preview_size)]
+        self._move_numbers = {}
+        self._rendered_points = []
         for idx, move in enumerate(moves, start=1):
-            nx = move.x - offset_x
-            ny = move.y - offset_y
-            if 0 <= nx < preview_size and 0 <= ny < preview_size:
-                board_state[ny][nx] = move.color
-                move_numbers[(nx, ny)] = idx
-                last_move = (nx, ny)
-
-        self.board_canvas.board_state = board_state
-        self.board_canvas.move_numbers = move_numbers
-        self.board_canvas.last_move = last_move
-        self.board_canvas._hint_pos = None
-        self.board_canvas.delete("hint")
-        self.board_canvas.refresh()
+            point = self._region_point(move, region)
+            self._rendered_points.append(point)
+            if point:
+                nx, ny = point
+                self._board_state[ny][nx] = move.color
+                self._move_numbers[point] = idx
+        self._rendered_joseki_id = id(self.current_joseki)
+        self._rendered_region = region
+
+    def _update_board_incrementally(self, moves: List, region: Tuple[int, int, int]) -> bool:
+        """Apply a one-move step (Next/Prev) to the kept board state; False means rebuild."""
+        if (
+            self._rendered_joseki_id != id(self.current_joseki)
+            or self._rendered_region != region
+        ):
+            return False
+        count = len(self._rendered_points)
+        if len(moves) == count + 1:
+            point = self._region_point(moves[-1], region)
+            if point in self._move_numbers:
+                # Replaying on an occupied point cannot be undone by a plain pop.
+                return False
+            self._rendered_points.append(point)
+            if point:
+                nx, ny = point
+                self._board_state[ny][nx] = moves[-1].color
+                self._move_numbers[point] = len(moves)
+            return True
+        if len(moves) == count - 1:
+            point = self._rendered_points[-1]
+            if point and point in self._rendered_points[:-1]:
+                return False
+            self._rendered_points.pop()
+            if point:
+                nx, ny = point
+                self._board_state[ny][nx] = ""
+                del self._move_numbers[point]
+            return True
+        return len(moves) == count
+
+    def _get_main_line(self) -> List[JosekiMove]:
+        """Main line of the current joseki, walked once per joseki."""
+        key = id(self.current_joseki)
+        main_line = self._main_line_cache.get(key)
+        if main_line is None:
+            main_line = self._main_line_cache[key] = self.current_joseki.get_main_line()
+        return main_line
+
+    def _get_preview_region(self) -> Tuple[int, int, int]:
+        """Preview region for the current joseki's full main line."""
+        key = id(self.current_joseki)
+        region = self._preview_region_cache.get(key)
+        if region is None:
+            region = self._preview_region_cache[key] = self._calculate_preview_region(
+                self._get_main_line()
+            )
+        return region
 
     def _first_move(self) -> None:
         self.current_move_index = 0
@@ -304,7 +536,7 @@ class JosekiDictionaryWindow(tk.Toplevel):
     def _last_move(self) -> None:
         if not self.current_joseki:
             return
-        main_line = self.current_joseki.get_main_line()
+        main_line = self._get_main_line()
         if not main_line:
             return
         self.current_move_index = len(main_line) - 1
@@ -313,7 +545,7 @@ class JosekiDictionaryWindow(tk.Toplevel):
     def _next_move(self) -> None:
         if not self.current_joseki:
             return
-        main_line = self.current_joseki.get_main_line()
+        main_line = self._get_main_line()
         if self.current_move_index < len(main_line) - 1:
             self.current_move_index += 1
             self._update_display()
@@ -324,15 +556,18 @@ class JosekiDictionaryWindow(tk.Toplevel):
             self._update_display()
 
     def _format_joseki_type(self, joseki_type: JosekiType) -> str:
-        mapping = {
-            JosekiType.CORNER: self.translator.get("joseki_type_corner"),
-            JosekiType.SIDE: self.translator.get("joseki_type_side"),
-            JosekiType.INVASION: self.translator.get("joseki_type_invasion"),
-            JosekiType.REDUCTION: self.translator.get("joseki_type_reduction"),
-            JosekiType.SPECIAL: self.translator.get("joseki_type_special"),
-            JosekiType.OPENING: self.translator.get("joseki_type_opening"),
-            JosekiType.FIGHTING: self.translator.get("joseki_type_fighting"),
-        }
+        lang = getattr(self.translator, "language", "") or ""
+        mapping = self._type_mapping_cache.get(lang)
+        if mapping is None:
+            mapping = self._type_mapping_cache[lang] = {
+                JosekiType.CORNER: self.translator.get("joseki_type_corner"),
+                JosekiType.SIDE: self.translator.get("joseki_type_side"),
+                JosekiType.INVASION: self.translator.get("joseki_type_invasion"),
+                JosekiType.REDUCTION: self.translator.get("joseki_type_reduction"),
+                JosekiType.SPECIAL: self.translator.get("joseki_type_special"),
+                JosekiType.OPENING: self.translator.get("joseki_type_opening"),
+                JosekiType.FIGHTING: self.translator.get("joseki_type_fighting"),
+            }
         return mapping.get(joseki_type, joseki_type.value)
 
     def _localize_joseki_name(self, joseki: JosekiSequence) -> str:
@@ -364,29 +599,92 @@ class JosekiDictionaryWindow(tk.Toplevel):
     def _lookup_translation(self, key: str) -> str:
         translations = getattr(self.translator, "translations", {}) or {}
         lang = getattr(self.translator, "language", "") or ""
-        lang_dict = translations.get(lang, {})
+        if lang != self._translation_lang or translations is not self._translation_source:
+            self._lang_dict = translations.get(lang, {})
+            self._en_dict = translations.get("en", {})
+            self._translation_lang = lang
+            self._translation_source = translations
+        lang_dict = self._lang_dict
         if key in lang_dict:
             return lang_dict[key]
-        en_dict = translations.get("en", {})
-        if key in en_dict:
-            return en_dict[key]
-        return ""
+        return self._en_dict.get(key, "")
 
     def _matches_keyword(self, joseki: JosekiSequence, keyword: str) -> bool:
         if not keyword:
             return True
-        name = self._localize_joseki_name(joseki).lower()
-        comment = self._localize_joseki_comment(joseki).lower()
-        if keyword in name or keyword in comment:
-            return True
-        tags = [str(tag).lower() for tag in joseki.tags]
-        return any(keyword in tag for tag in tags)
+        return keyword in self._search_blob(joseki)
+
+    def _sync_search_cache_language(self) -> None:
+        lang = getattr(self.translator, "language", "") or ""
+        if lang != self._search_index_lang:
+            self._search_index.clear()
+            self._qgram_index.clear()
+            self._postings.clear()
+            # Results matched in the old language must not be reused or narrowed.
+            self._last_keyword = ""
+            self._last_results = None
+            self._search_index_lang = lang
+
+    def _search_blob(self, joseki: JosekiSequence) -> str:
+        """Lowercased name/comment/tags joined by a separator, cached per language."""
+        self._sync_search_cache_language()
+        blob = self._search_index.get(id(joseki))
+        if blob is None:
+            parts = [
+                self._localize_joseki_name(joseki),
+                self._localize_joseki_comment(joseki),
+                *(str(tag) for tag in joseki.tags),
+            ]
+            blob = "\x1f".join(parts).lower()
+            self._search_index[id(joseki)] = blob
+        return blob
+
+    def _filter_by_substring(self, candidates, keyword: str) -> List[JosekiSequence]:
+        if len(keyword) >= 3:
+            # Any substring match must contain the keyword's first 3-gram.
+            probe = keyword[:3]
+            candidates = [joseki for joseki in candidates if probe in self._qgrams(joseki)]
+        return [joseki for joseki in candidates if self._matches_keyword(joseki, keyword)]
+
+    def _token_postings(self, token: str) -> FrozenSet[int]:
+        """ids of every joseki whose searchable text contains ``token``, cached per language."""
+        self._sync_search_cache_language()
+        postings = self._postings.get(token)
+        if postings is None:
+            postings = frozenset(
+                id(joseki)
+                for joseki in self._filter_by_substring(self.database.joseki_dict.values(), token)
+            )
+            self._postings[token] = postings
+        return postings
+
+    def _qgrams(self, joseki: JosekiSequence) -> FrozenSet[str]:
+        """All 3-character substrings of the searchable fields (no cross-field grams)."""
+        grams = self._qgram_index.get(id(joseki))
+        if grams is None:
+            grams = frozenset(
+                text[i : i + 3]
+                for text in self._search_blob(joseki).split("\x1f")
+                for i in range(len(text) - 2)
+            )
+            self._qgram_index[id(joseki)] = grams
+        return grams
 
     def _calculate_preview_region(self, moves: List) -> Tuple[int, int, int]:
-        min_x = min(move.x for move in moves)
-        max_x = max(move.x for move in moves)
-        min_y = min(move.y for move in moves)
-        max_y = max(move.y for move in moves)
+        it = iter(moves)
+        first = next(it)
+        min_x = max_x = first.x
+        min_y = max_y = first.y
+        for move in it:
+            x, y = move.x, move.y
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
 
         width = max_x - min_x + 1
         height = max_y - min_y + 1
@@ -422,9 +720,14 @@ class JosekiDictionaryWindow(tk.Toplevel):
         if context:
             query = f"{query} {context}".strip()
 
-        engine = "google" if getattr(self.translator, "language", "") == "en" else "bing"
-        base_url = "https://www.google.com/search?q=" if engine == "google" else "https://www.bing.com/search?q="
-        return base_url + quote_plus(query)
+        language = getattr(self.translator, "language", "")
+        if self._cached_base_url is None or language != self._cached_url_lang:
+            engine = "google" if language == "en" else "bing"
+            self._cached_base_url = (
+                "https://www.google.com/search?q=" if engine == "google" else "https://www.bing.com/search?q="
+            )
+            self._cached_url_lang = language
+        return _build_url(self._cached_base_url, query)
 
 
 __all__ = ["JosekiDictionaryWindow"]
@@ -3,8 +3,11 @@ UI面板组件
 包含信息面板、控制面板、分析面板等
 """
 
+import functools
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import ttk
+from tkinter import font as tkfont
 from typing import Optional, Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
@@ -12,6 +15,78 @@ from .translator import Translator
 from .themes import Theme
 
 
+# 胜率条随窗口缩放重绘的合并延迟（毫秒）
+_WINRATE_RESIZE_DELAY_MS = 40
+
+# 分析面板最多显示的推荐着法数
+_MAX_SUGGESTIONS = 10
+
+# 拖动进度条时跳转棋谱位置的合并间隔（毫秒）
+_SCALE_GOTO_DELAY_MS = 30
+
+# 棋盘列字母（跳过 I）及预先拼好的劫点坐标文本，按 [x][y] 索引
+_SGF_COLS = 'ABCDEFGHJKLMNOPQRST'
+_KO_COORD = tuple(
+    tuple(f'{_SGF_COLS[x]}{19 - y}' for y in range(19)) for x in range(19)
+)
+
+
+# ControlPanel 中与 callbacks 同名的按钮（属性名为 <name>_button）
+_CONTROL_BUTTONS = (
+    'pass', 'resign', 'undo', 'redo', 'end_game',
+    'analyze', 'score', 'hint', 'estimate',
+)
+
+
+def _noop(*_args):
+    """未设置回调时的占位"""
+
+
+def _to_float(value: Any, default: float) -> float:
+    """非 float 数值的转换兜底：无法转换时返回 default"""
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+def _dict_analysis_fields(analysis: Dict[str, Any]):
+    """从 dict 形式的分析结果中取出 (胜率, 领地, 推荐着法, 深度)"""
+    return (
+        analysis.get('winrate', 0.5),
+        analysis.get('territory_estimate') or {},
+        analysis.get('best_moves') or [],
+        analysis.get('analysis_depth') or 0,
+    )
+
+
+def _attr_analysis_fields(analysis: Any):
+    """从 PositionAnalysis 等对象中取出 (胜率, 领地, 推荐着法, 深度)"""
+    return (
+        getattr(analysis, 'winrate', 0.5),
+        getattr(analysis, 'territory_estimate', None) or {},
+        getattr(analysis, 'best_moves', None) or [],
+        getattr(analysis, 'analysis_depth', 0) or 0,
+    )
+
+
+def _dict_move_fields(move: Dict[str, Any]):
+    """从 dict 形式的推荐着法中取出 (坐标文本, 胜率, 访问数)"""
+    move_text = move.get('move')
+    if not move_text:
+        move_text = f"{move.get('x', -1)},{move.get('y', -1)}"
+    return move_text, move.get('winrate', 0.0), int(move.get('visits', 0) or 0)
+
+
+def _attr_move_fields(get_coord: Optional[Callable[[Any], str]], move: Any):
+    """从对象形式的推荐着法中取出 (坐标文本, 胜率, 访问数)；get_coord 为类型上的坐标方法"""
+    if get_coord is not None:
+        move_text = get_coord(move)
+    else:
+        move_text = f"{getattr(move, 'x', -1)},{getattr(move, 'y', -1)}"
+    return move_text, getattr(move, 'winrate', 0.0), int(getattr(move, 'visits', 0) or 0)
+
+
 class BasePanel(ttk.Frame):
     """面板基类"""
     
@@ -21,88 +96,184 @@ class BasePanel(ttk.Frame):
         
         self.translator = translator or Translator()
         self.theme = theme or Theme(name='default')
+        # 翻译查询缓存：刷新频繁的文本直接命中缓存
+        self._t = functools.lru_cache(maxsize=128)(self.translator.get)
+        self._last_text: Dict[int, str] = {}
+        self._batch_depth = 0
+        self._pending_text: Dict[int, Tuple[Any, str]] = {}
+        self._text_vars: Dict[int, tk.StringVar] = {}
         
         # 应用主题样式
         self._apply_theme()
     
+    @staticmethod
+    def _theme_signature(theme: Theme) -> Tuple:
+        """返回 _apply_theme 用到的主题字段，用于判断样式是否需要重新配置"""
+        return (
+            theme.name,
+            theme.ui_background,
+            theme.ui_panel_background,
+            theme.ui_text_primary,
+            theme.ui_text_disabled,
+            theme.input_background,
+            theme.font_size_normal,
+            theme.font_size_small,
+        )
+    
     def _apply_theme(self):
         """应用主题样式"""
-        style = ttk.Style(self)
+        sig = self._theme_signature(self.theme)
+        self._theme_sig = sig
+        # ttk 样式在同一解释器内全局共享；签名与 Style 实例记在根窗口上，
+        # 随根窗口一起销毁，重建的根窗口会重新配置
+        root = self._root()
+        if getattr(root, '_panel_theme_sig', None) == sig:
+            # 其他面板已用相同主题配置过这些样式
+            self.configure(style='Panel.TFrame')
+            return
+        root._panel_theme_sig = sig
+        
+        style = getattr(root, '_panel_style', None)
+        if style is None:
+            style = root._panel_style = ttk.Style(root)
+        
+        theme = self.theme
+        bg = theme.ui_background
+        panel_bg = theme.ui_panel_background
+        fg = theme.ui_text_primary
+        disabled_fg = theme.ui_text_disabled
+        input_bg = theme.input_background
+        title_font = self._named_font('PanelTitleFont', max(10, int(theme.font_size_normal)))
+        heading_font = self._named_font('PanelHeadingFont', max(10, int(theme.font_size_small)))
         
         # 统一面板样式（只影响使用 Panel.* 样式名的控件）
         # 外层：更浅的背景；卡片/分组：更深一些的背景，形成层次。
         style.configure(
             'Panel.TFrame',
-            background=self.theme.ui_background,
+            background=bg,
             relief='flat',
             borderwidth=0,
         )
 
         style.configure(
             'PanelCard.TFrame',
-            background=self.theme.ui_panel_background,
+            background=panel_bg,
             relief='flat',
             borderwidth=0,
         )
         
         style.configure('Panel.TLabel',
-                       background=self.theme.ui_panel_background,
-                       foreground=self.theme.ui_text_primary)
+                       background=panel_bg,
+                       foreground=fg)
         
         style.configure('Panel.TLabelframe',
-                       background=self.theme.ui_panel_background,
-                       foreground=self.theme.ui_text_primary,
+                       background=panel_bg,
+                       foreground=fg,
                        relief='solid',
                        borderwidth=1)
         
         style.configure('Panel.TLabelframe.Label',
-                       background=self.theme.ui_panel_background,
-                       foreground=self.theme.ui_text_primary,
-                       font=('Segoe UI', max(10, int(self.theme.font_size_normal)), 'bold'))
+                       background=panel_bg,
+                       foreground=fg,
+                       font=title_font)
 
         style.configure('Panel.TButton', padding=(10, 6))
         style.map(
             'Panel.TButton',
-            foreground=[('disabled', self.theme.ui_text_disabled)],
+            foreground=[('disabled', disabled_fg)],
         )
 
         style.configure(
             'Panel.TCheckbutton',
-            background=self.theme.ui_panel_background,
-            foreground=self.theme.ui_text_primary,
+            background=panel_bg,
+            foreground=fg,
             padding=(6, 3),
         )
         style.map(
             'Panel.TCheckbutton',
-            background=[('active', self.theme.ui_panel_background)],
-            foreground=[('disabled', self.theme.ui_text_disabled)],
+            background=[('active', panel_bg)],
+            foreground=[('disabled', disabled_fg)],
         )
 
         style.configure(
             'Panel.Treeview',
-            background=self.theme.input_background,
-            fieldbackground=self.theme.input_background,
-            foreground=self.theme.ui_text_primary,
+            background=input_bg,
+            fieldbackground=input_bg,
+            foreground=fg,
             rowheight=22,
         )
         style.configure(
             'Panel.Treeview.Heading',
-            background=self.theme.ui_panel_background,
-            foreground=self.theme.ui_text_primary,
-            font=('Segoe UI', max(10, int(self.theme.font_size_small)), 'bold'),
+            background=panel_bg,
+            foreground=fg,
+            font=heading_font,
             relief='flat',
         )
         
         self.configure(style='Panel.TFrame')
     
+    def _named_font(self, name: str, size: int) -> str:
+        """获取（必要时创建）根窗口内共享的粗体命名字体，返回字体名"""
+        root = self._root()
+        fonts = getattr(root, '_panel_fonts', None)
+        if fonts is None:
+            fonts = root._panel_fonts = {}
+        font = fonts.get(name)
+        if font is None:
+            # 持有引用：Font 对象被回收时会删除其创建的命名字体；随根窗口一起释放
+            font = fonts[name] = tkfont.Font(
+                root=root, name=name, family='Segoe UI', size=size, weight='bold'
+            )
+        elif int(font.cget('size')) != size:
+            font.configure(size=size)
+        return name
+    
+    @contextmanager
+    def _batched(self):
+        """批量更新（可重入）：期间的文本写入只保留最终值，在最外层退出时统一提交"""
+        depth = self._batch_depth
+        self._batch_depth = depth + 1
+        try:
+            yield
+        finally:
+            self._batch_depth = depth
+            if depth == 0 and self._pending_text:
+                pending, self._pending_text = self._pending_text, {}
+                for widget, text in pending.values():
+                    self._set_text(widget, text)
+    
+    def _set_text(self, widget, text: str):
+        """仅在文本变化时调用 configure，减少与 Tcl 的往返"""
+        key = id(widget)
+        if self._batch_depth:
+            self._pending_text[key] = (widget, text)
+            return
+        if self._last_text.get(key) != text:
+            var = self._text_vars.get(key)
+            if var is not None:
+                var.set(text)
+            else:
+                widget.configure(text=text)
+            self._last_text[key] = text
+    
+    def _label(self, parent, **kwargs) -> ttk.Label:
+        """创建绑定 StringVar 的标签：频繁刷新的文本改为写变量，而非 configure"""
+        var = tk.StringVar(self)
+        label = ttk.Label(parent, textvariable=var, **kwargs)
+        self._text_vars[id(label)] = var
+        return label
+    
     def update_translator(self, translator: Translator):
         """更新翻译器"""
         self.translator = translator
+        self._t = functools.lru_cache(maxsize=128)(translator.get)
         self._update_texts()
     
     def update_theme(self, theme: Theme):
         """更新主题"""
         self.theme = theme
+        if self._theme_signature(theme) == self._theme_sig:
+            return
         self._apply_theme()
     
     def _update_texts(self):
@@ -120,9 +291,21 @@ class InfoPanel(BasePanel):
         # 只传递有效的 kwargs 给父类
         super().__init__(parent, **kwargs)
         
+        self._thinking_state: Optional[bool] = None
+        self._last_game_info: Optional[tuple] = None
+        self._refresh_prefixes()
+        self._phase_text = self._phase_prefix + self._t('playing')
         self._create_widgets()
         self._update_texts()
     
+    def _refresh_prefixes(self):
+        """缓存高频刷新文本的翻译前缀（切换语言时重新生成）"""
+        self._move_prefix = self._t('move') + ': '
+        self._captured_prefix = self._t('captured') + ': '
+        self._ko_prefix = self._t('ko') + ': '
+        self._phase_prefix = self._t('phase') + ': '
+        self._analyzing_text = self._phase_prefix + self._t('analyzing')
+    
     def _create_widgets(self):
         """创建控件"""
         # 玩家信息框架
@@ -195,6 +378,13 @@ class InfoPanel(BasePanel):
                                           bg=self.theme.ui_panel_background,
                                           highlightthickness=0)
         self.current_indicator.pack(side='left', padx=5)
+        self._cur_black = self.current_indicator.create_oval(
+            2, 2, 14, 14, fill='black', outline='#333', state='hidden'
+        )
+        self._cur_white = self.current_indicator.create_oval(
+            2, 2, 14, 14, fill='white', outline='#ccc', state='hidden'
+        )
+        self._last_cur_player: Optional[str] = None
         
         self.move_number_label = ttk.Label(self.game_frame, style='Panel.TLabel')
         self.move_number_label.pack(padx=5, pady=2)
@@ -211,65 +401,71 @@ class InfoPanel(BasePanel):
     
     def _update_texts(self):
         """更新文本"""
-        self.players_frame.configure(text=self.translator.get('players'))
-        self.game_frame.configure(text=self.translator.get('game_info'))
-        self.current_player_label.configure(
-            text=f"{self.translator.get('current_player')}:"
-        )
-        self.phase_label.configure(
-            text=f"{self.translator.get('phase')}: {self.translator.get('playing')}"
+        self._refresh_prefixes()
+        self._last_game_info = None
+        self._set_text(self.players_frame, self._t('players'))
+        self._set_text(self.game_frame, self._t('game_info'))
+        self._set_text(
+            self.current_player_label,
+            f"{self._t('current_player')}:"
         )
+        self._set_text(self.phase_label, self._phase_prefix + self._t('playing'))
     
     def update_player_info(self, black_name: str, white_name: str,
                           black_time: str = "∞", white_time: str = "∞",
                           black_captured: int = 0, white_captured: int = 0):
         """更新玩家信息"""
-        self.black_name_label.configure(text=black_name)
-        self.white_name_label.configure(text=white_name)
+        set_text = self._set_text
+        set_text(self.black_name_label, black_name)
+        set_text(self.white_name_label, white_name)
         
-        self.black_time_label.configure(text=f"⏱ {black_time}")
-        self.white_time_label.configure(text=f"⏱ {white_time}")
+        set_text(self.black_time_label, f"⏱ {black_time}")
+        set_text(self.white_time_label, f"⏱ {white_time}")
         
-        self.black_captured_label.configure(
-            text=f"{self.translator.get('captured')}: {black_captured}"
-        )
-        self.white_captured_label.configure(
-            text=f"{self.translator.get('captured')}: {white_captured}"
-        )
+        captured_prefix = self._captured_prefix
+        set_text(self.black_captured_label, captured_prefix + str(black_captured))
+        set_text(self.white_captured_label, captured_prefix + str(white_captured))
     
     def update_game_info(self, current_player: str, move_number: int,
                         ko_point: Optional[Tuple[int, int]] = None,
                         phase: str = 'playing'):
         """更新游戏信息"""
-        # 更新当前玩家指示
-        self.current_indicator.delete('all')
-        if current_player == 'black':
-            self.current_indicator.create_oval(2, 2, 14, 14, fill='black', outline='#333')
-        else:
-            self.current_indicator.create_oval(2, 2, 14, 14, fill='white', outline='#ccc')
+        state = (current_player, move_number, ko_point, phase)
+        if state == self._last_game_info:
+            return
+        self._last_game_info = state
+        
+        # 更新当前玩家指示（两个圆预先创建，仅切换显示状态）
+        if current_player != self._last_cur_player:
+            is_black = current_player == 'black'
+            self.current_indicator.itemconfigure(
+                self._cur_black, state='normal' if is_black else 'hidden'
+            )
+            self.current_indicator.itemconfigure(
+                self._cur_white, state='hidden' if is_black else 'normal'
+            )
+            self._last_cur_player = current_player
         
         # 更新手数
-        self.move_number_label.configure(
-            text=f"{self.translator.get('move')}: {move_number}"
-        )
+        self._set_text(self.move_number_label, self._move_prefix + str(move_number))
         
         # 更新劫点
         if ko_point:
-            letters = 'ABCDEFGHJKLMNOPQRST'
-            ko_text = f"{self.translator.get('ko')}: {letters[ko_point[0]]}{19 - ko_point[1]}"
-            self.ko_label.configure(text=ko_text)
+            ko_text = self._ko_prefix + _KO_COORD[ko_point[0]][ko_point[1]]
+            self._set_text(self.ko_label, ko_text)
         else:
-            self.ko_label.configure(text="")
+            self._set_text(self.ko_label, "")
         
         # 更新阶段
-        phase_text = self.translator.get(phase)
-        self.phase_label.configure(
-            text=f"{self.translator.get('phase')}: {phase_text}"
-        )
+        self._phase_text = self._phase_prefix + self._t(phase)
+        self._set_text(self.phase_label, self._phase_text)
+        self._thinking_state = None
 
     def set_phase_text(self, text: str):
         """直接设置阶段显示文本（用于动态信息，如数子预览结果）。"""
-        self.phase_label.configure(text=text)
+        self._set_text(self.phase_label, text)
+        self._thinking_state = None
+        self._last_game_info = None
 
     # --- 兼容 main.py 的方法（旧版 UI 调用） ---
 
@@ -287,31 +483,35 @@ class InfoPanel(BasePanel):
         black_captured = int(game_info.get('captured_black', 0) or 0)
         white_captured = int(game_info.get('captured_white', 0) or 0)
 
-        self.update_player_info(
-            black_name=black_name,
-            white_name=white_name,
-            black_time=black_time,
-            white_time=white_time,
-            black_captured=black_captured,
-            white_captured=white_captured,
-        )
+        with self._batched():
+            self.update_player_info(
+                black_name=black_name,
+                white_name=white_name,
+                black_time=black_time,
+                white_time=white_time,
+                black_captured=black_captured,
+                white_captured=white_captured,
+            )
 
-        self.update_game_info(
-            current_player=game_info.get('current_player', 'black'),
-            move_number=int(game_info.get('move_number', 0) or 0),
-            ko_point=game_info.get('ko_point'),
-            phase=game_info.get('phase', 'playing'),
-        )
+            self.update_game_info(
+                current_player=game_info.get('current_player', 'black'),
+                move_number=int(game_info.get('move_number', 0) or 0),
+                ko_point=game_info.get('ko_point'),
+                phase=game_info.get('phase', 'playing'),
+            )
 
     def show_thinking(self, thinking: bool = True):
-        """兼容旧接口：AI思考提示（当前为轻量占位）。"""
+        """兼容旧接口：AI思考提示，仅在状态切换时更新显示。"""
+        thinking = bool(thinking)
+        if thinking == self._thinking_state:
+            return
+        self._thinking_state = thinking
+        self._last_game_info = None
         if thinking:
-            self.phase_label.configure(
-                text=f"{self.translator.get('phase')}: {self.translator.get('analyzing')}"
-            )
+            self._set_text(self.phase_label, self._analyzing_text)
         else:
-            # 恢复为默认显示（由 update_info/update_game_info 再次覆盖）
-            return
+            # 恢复最近一次 update_game_info 的阶段显示
+            self._set_text(self.phase_label, self._phase_text)
 
 
 class ControlPanel(BasePanel):
@@ -369,6 +569,8 @@ class ControlPanel(BasePanel):
             'show_influence': bool(show_influence),
         }
         
+        self._btn_state: Dict[int, str] = {}
+        
         # 只传递有效的 kwargs 给父类
         super().__init__(parent, **kwargs)
         
@@ -460,24 +662,25 @@ class ControlPanel(BasePanel):
     
     def _bind_events(self):
         """绑定事件"""
-        self.pass_button.configure(command=lambda: self._callback('pass'))
-        self.resign_button.configure(command=lambda: self._callback('resign'))
-        self.undo_button.configure(command=lambda: self._callback('undo'))
-        self.redo_button.configure(command=lambda: self._callback('redo'))
-        self.end_game_button.configure(command=lambda: self._callback('end_game'))
-        self.analyze_button.configure(command=lambda: self._callback('analyze'))
-        self.score_button.configure(command=lambda: self._callback('score'))
-        self.hint_button.configure(command=lambda: self._callback('hint'))
-        self.estimate_button.configure(command=lambda: self._callback('estimate'))
-        
-        self.show_coordinates_var.trace('w', 
-            lambda *args: self._callback('show_coordinates', self.show_coordinates_var.get()))
-        self.show_move_numbers_var.trace('w',
-            lambda *args: self._callback('show_move_numbers', self.show_move_numbers_var.get()))
-        self.show_territory_var.trace('w',
-            lambda *args: self._callback('show_territory', self.show_territory_var.get()))
-        self.show_influence_var.trace('w',
-            lambda *args: self._callback('show_influence', self.show_influence_var.get()))
+        self._sync_callbacks()
+        for name, var in (
+            ('show_coordinates', self.show_coordinates_var),
+            ('show_move_numbers', self.show_move_numbers_var),
+            ('show_territory', self.show_territory_var),
+            ('show_influence', self.show_influence_var),
+        ):
+            var.trace_add('write', functools.partial(self._on_bool_toggle, f'_cb_{name}', var))
+    
+    def _sync_callbacks(self):
+        """将 callbacks 字典中的回调绑定为属性，按钮直接调用，避免每次点击查字典"""
+        for name, func in self.callbacks.items():
+            setattr(self, f'_cb_{name}', func or _noop)
+        for name in _CONTROL_BUTTONS:
+            getattr(self, f'{name}_button').configure(command=getattr(self, f'_cb_{name}'))
+    
+    def _on_bool_toggle(self, attr: str, var: tk.BooleanVar, *_trace_args):
+        """显示选项勾选变化"""
+        getattr(self, attr)(var.get())
     
     # 修改 _callback 方法来使用已保存的回调
     def _callback(self, name: str, *args):
@@ -487,42 +690,53 @@ class ControlPanel(BasePanel):
     
     def _update_texts(self):
         """更新文本"""
-        self.game_control_frame.configure(text=self.translator.get('game_control'))
-        self.pass_button.configure(text=self.translator.get('pass'))
-        self.resign_button.configure(text=self.translator.get('resign'))
-        self.undo_button.configure(text=self.translator.get('undo'))
-        self.redo_button.configure(text=self.translator.get('redo'))
-        self.end_game_button.configure(text=self.translator.get('end_game'))
-        
-        self.analysis_control_frame.configure(text=self.translator.get('analysis'))
-        self.analyze_button.configure(text=self.translator.get('analyze'))
-        self.score_button.configure(text=self.translator.get('score'))
-        self.hint_button.configure(text=self.translator.get('hint'))
-        self.estimate_button.configure(text=self.translator.get('estimate'))
-        
-        self.display_frame.configure(text=self.translator.get('display'))
-        self.show_coordinates_check.configure(text=self.translator.get('show_coordinates'))
-        self.show_move_numbers_check.configure(text=self.translator.get('show_move_numbers'))
-        self.show_territory_check.configure(text=self.translator.get('show_territory'))
-        self.show_influence_check.configure(text=self.translator.get('show_influence'))
+        widgets = (
+            (self.game_control_frame, 'game_control'),
+            (self.pass_button, 'pass'),
+            (self.resign_button, 'resign'),
+            (self.undo_button, 'undo'),
+            (self.redo_button, 'redo'),
+            (self.end_game_button, 'end_game'),
+            (self.analysis_control_frame, 'analysis'),
+            (self.analyze_button, 'analyze'),
+            (self.score_button, 'score'),
+            (self.hint_button, 'hint'),
+            (self.estimate_button, 'estimate'),
+            (self.display_frame, 'display'),
+            (self.show_coordinates_check, 'show_coordinates'),
+            (self.show_move_numbers_check, 'show_move_numbers'),
+            (self.show_territory_check, 'show_territory'),
+            (self.show_influence_check, 'show_influence'),
+        )
+        texts = self.translator.getmany(tuple(key for _, key in widgets))
+        for (widget, _), text in zip(widgets, texts):
+            self._set_text(widget, text)
     
     def set_callbacks(self, callbacks: Dict[str, Callable]):
         """设置回调函数"""
         self.callbacks.update(callbacks)
+        self._sync_callbacks()
+    
+    def _set_state(self, button, state: str):
+        """仅在状态变化时调用 configure"""
+        key = id(button)
+        if self._btn_state.get(key) != state:
+            button.configure(state=state)
+            self._btn_state[key] = state
     
     def enable_controls(self, enabled: bool = True):
         """启用/禁用控件"""
         state = 'normal' if enabled else 'disabled'
         
-        self.pass_button.configure(state=state)
-        self.resign_button.configure(state=state)
-        self.undo_button.configure(state=state)
-        self.redo_button.configure(state=state)
-        self.end_game_button.configure(state=state)
-        self.analyze_button.configure(state=state)
-        self.score_button.configure(state=state)
-        self.hint_button.configure(state=state)
-        self.estimate_button.configure(state=state)
+        self._set_state(self.pass_button, state)
+        self._set_state(self.resign_button, state)
+        self._set_state(self.undo_button, state)
+        self._set_state(self.redo_button, state)
+        self._set_state(self.end_game_button, state)
+        self._set_state(self.analyze_button, state)
+        self._set_state(self.score_button, state)
+        self._set_state(self.hint_button, state)
+        self._set_state(self.estimate_button, state)
 
     # --- 兼容 main.py 的方法（旧版 UI 调用） ---
 
@@ -539,46 +753,44 @@ class ControlPanel(BasePanel):
 
         if is_scoring:
             # 进入数子阶段（通常由连续虚手触发）：仅保留“确认结果”以结束对局
-            self.pass_button.configure(state='disabled')
-            self.resign_button.configure(state='disabled')
-            self.undo_button.configure(state='disabled')
-            self.redo_button.configure(state='disabled')
-            self.end_game_button.configure(state='normal')
-            self.analyze_button.configure(state='disabled')
-            self.score_button.configure(state='disabled')
-            self.hint_button.configure(state='disabled')
-            self.estimate_button.configure(state='disabled')
-            self.end_game_button.configure(text=self.translator.get('finish_scoring', self.translator.get('done')))
+            self._set_state(self.pass_button, 'disabled')
+            self._set_state(self.resign_button, 'disabled')
+            self._set_state(self.undo_button, 'disabled')
+            self._set_state(self.redo_button, 'disabled')
+            self._set_state(self.end_game_button, 'normal')
+            self._set_state(self.analyze_button, 'disabled')
+            self._set_state(self.score_button, 'disabled')
+            self._set_state(self.hint_button, 'disabled')
+            self._set_state(self.estimate_button, 'disabled')
+            self._set_text(self.end_game_button, self._t('finish_scoring', self._t('done')))
         elif is_teaching:
-            self.pass_button.configure(state=play_state)
-            self.resign_button.configure(state='disabled')
-            self.undo_button.configure(state='disabled')
-            self.redo_button.configure(state='disabled')
-            self.end_game_button.configure(state='normal')
-            self.analyze_button.configure(state=play_state)
-            self.score_button.configure(state=play_state)
-            self.hint_button.configure(state=play_state)
-            self.estimate_button.configure(state=play_state)
-            self.end_game_button.configure(text=self.translator.get('exit_teaching', self.translator.get('done')))
+            self._set_state(self.pass_button, play_state)
+            self._set_state(self.resign_button, 'disabled')
+            self._set_state(self.undo_button, 'disabled')
+            self._set_state(self.redo_button, 'disabled')
+            self._set_state(self.end_game_button, 'normal')
+            self._set_state(self.analyze_button, play_state)
+            self._set_state(self.score_button, play_state)
+            self._set_state(self.hint_button, play_state)
+            self._set_state(self.estimate_button, play_state)
+            self._set_text(self.end_game_button, self._t('exit_teaching', self._t('done')))
         else:
-            self.pass_button.configure(state=play_state)
-            self.resign_button.configure(state=play_state)
-            self.end_game_button.configure(state=play_state)
-            self.analyze_button.configure(state=play_state)
-            self.score_button.configure(state=play_state)
-            self.hint_button.configure(state=play_state)
-            self.estimate_button.configure(state=play_state)
-            self.score_button.configure(text=self.translator.get('score'))
-            self.end_game_button.configure(text=self.translator.get('end_game'))
+            self._set_state(self.pass_button, play_state)
+            self._set_state(self.resign_button, play_state)
+            self._set_state(self.end_game_button, play_state)
+            self._set_state(self.analyze_button, play_state)
+            self._set_state(self.score_button, play_state)
+            self._set_state(self.hint_button, play_state)
+            self._set_state(self.estimate_button, play_state)
+            self._set_text(self.score_button, self._t('score'))
+            self._set_text(self.end_game_button, self._t('end_game'))
 
         if not is_scoring and not is_teaching:
-            self.undo_button.configure(state='normal' if can_undo else 'disabled')
-            self.redo_button.configure(state='normal' if can_redo else 'disabled')
+            self._set_state(self.undo_button, 'normal' if can_undo else 'disabled')
+            self._set_state(self.redo_button, 'normal' if can_redo else 'disabled')
 
     def set_pause_text(self, text: str):
         """兼容旧接口：部分UI版本包含暂停按钮；当前版本无该按钮，保留接口避免崩溃。"""
-        if hasattr(self, 'pause_button'):
-            self.pause_button.configure(text=text)
 
 """
 UI面板组件（续）
@@ -590,13 +802,44 @@ UI面板组件（续）
 class AnalysisPanel(BasePanel):
     """分析面板 - 显示AI分析、形势判断等"""
     
+    _DRAW_ORDER = ('winrate', 'territory', 'suggestions', 'analysis_info')
+    # 分析结果类型 -> 字段提取函数
+    _ANALYSIS_EXTRACTORS: Dict[type, Callable[[Any], Tuple]] = {}
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self._last_winrate = 50.0
+        self._wr_after_id: Optional[str] = None
+        # 胜率条画布的当前宽度，由 <Configure> 维护；未映射前为 0
+        self._wr_last_w = 0
+        self._last_sugg_key: Optional[tuple] = None
+        
+        # 更新只记录最新参数，在空闲时统一绘制
+        self._pending: Dict[str, tuple] = {}
+        self._flush_id: Optional[str] = None
         
         self._create_widgets()
         self._update_texts()
     
+    def _queue(self, name: str, args: tuple):
+        """记录一次更新；同一空闲周期内的多次更新只绘制最后一次"""
+        self._pending[name] = args
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """按固定顺序执行积压的绘制"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        pending, self._pending = self._pending, {}
+        # 文本写入统一在最后提交，一次刷新只产生一批标签更新
+        with self._batched():
+            for name in self._DRAW_ORDER:
+                args = pending.get(name)
+                if args is not None:
+                    getattr(self, f'_draw_{name}')(*args)
+    
     def _create_widgets(self):
         """创建控件"""
         # 形势判断框架
@@ -619,19 +862,32 @@ class AnalysisPanel(BasePanel):
             highlightbackground=self.theme.ui_panel_border
         )
         self.winrate_canvas.pack(fill='x', padx=5, pady=2)
-        self.winrate_canvas.bind('<Configure>', lambda e: self.update_winrate(self._last_winrate))
+        # 胜率条图元只创建一次，之后通过 coords/itemconfigure 更新
+        self._wr_black = self.winrate_canvas.create_rectangle(
+            0, 0, 1, 30, fill='#2c2c2c', outline=''
+        )
+        self._wr_white = self.winrate_canvas.create_rectangle(
+            1, 0, 2, 30, fill='#e0e0e0', outline=''
+        )
+        # 中线为静态背景，只在 <Configure> 时移动（未映射前按默认宽度 200 居中）
+        self._wr_midline = self.winrate_canvas.create_line(100, 0, 100, 30, fill='red', width=1)
+        self._wr_text = self.winrate_canvas.create_text(
+            0, 15, font=('Arial', 10, 'bold')
+        )
+        self._wr_drawn: Optional[Tuple[float, int]] = None
+        self.winrate_canvas.bind('<Configure>', self._on_winrate_configure)
         
         # 地盘估算
         self.territory_frame = ttk.Frame(self.situation_frame, style='PanelCard.TFrame')
         self.territory_frame.pack(fill='x', padx=2, pady=4)
         
-        self.black_territory_label = ttk.Label(self.territory_frame, style='Panel.TLabel')
+        self.black_territory_label = self._label(self.territory_frame, style='Panel.TLabel')
         self.black_territory_label.pack(side='left', padx=5)
         
-        self.white_territory_label = ttk.Label(self.territory_frame, style='Panel.TLabel')
+        self.white_territory_label = self._label(self.territory_frame, style='Panel.TLabel')
         self.white_territory_label.pack(side='right', padx=5)
         
-        self.territory_diff_label = ttk.Label(self.territory_frame, style='Panel.TLabel')
+        self.territory_diff_label = self._label(self.territory_frame, style='Panel.TLabel')
         self.territory_diff_label.pack()
         
         # 推荐着法框架
@@ -650,15 +906,24 @@ class AnalysisPanel(BasePanel):
         )
         
         self.suggestions_tree.heading('#0', text='#')
-        self.suggestions_tree.heading('move', text=self.translator.get('move'))
-        self.suggestions_tree.heading('winrate', text=self.translator.get('win_rate'))
-        self.suggestions_tree.heading('visits', text=self.translator.get('visits'))
+        self.suggestions_tree.heading('move', text=self._t('move'))
+        self.suggestions_tree.heading('winrate', text=self._t('win_rate'))
+        self.suggestions_tree.heading('visits', text=self._t('visits'))
         
         self.suggestions_tree.column('#0', width=30, stretch=False)
         self.suggestions_tree.column('move', width=60)
         self.suggestions_tree.column('winrate', width=80)
         self.suggestions_tree.column('visits', width=80)
         
+        # 预先创建固定数量的行，之后只修改内容，用 detach/move 隐藏或显示
+        self._sugg_iids = tuple(
+            self.suggestions_tree.insert('', 'end', text=str(i + 1))
+            for i in range(_MAX_SUGGESTIONS)
+        )
+        self.suggestions_tree.detach(*self._sugg_iids)
+        self._sugg_cells: List[Optional[Tuple[Any, str, Any]]] = [None] * _MAX_SUGGESTIONS
+        self._sugg_shown = 0
+        
         # 滚动条
         scrollbar = ttk.Scrollbar(
             self.suggestions_frame,
@@ -676,27 +941,37 @@ class AnalysisPanel(BasePanel):
         )
         self.info_frame.pack(fill='x', padx=8, pady=(0, 8))
         
-        self.thinking_time_label = ttk.Label(self.info_frame, style='Panel.TLabel')
+        self.thinking_time_label = self._label(self.info_frame, style='Panel.TLabel')
         self.thinking_time_label.pack(padx=5, pady=2)
         
-        self.nodes_label = ttk.Label(self.info_frame, style='Panel.TLabel')
+        self.nodes_label = self._label(self.info_frame, style='Panel.TLabel')
         self.nodes_label.pack(padx=5, pady=2)
         
-        self.depth_label = ttk.Label(self.info_frame, style='Panel.TLabel')
+        self.depth_label = self._label(self.info_frame, style='Panel.TLabel')
         self.depth_label.pack(padx=5, pady=2)
         
         # 初始化显示
-        self.update_winrate(50.0)
+        self._draw_winrate(self._last_winrate)
+    
+    def _refresh_translation_cache(self):
+        """缓存绘制路径上反复使用的翻译文本（切换语言时重新生成）"""
+        self._t_black = self._t('black')
+        self._t_white = self._t('white')
+        self._t_even = self._t('even')
+        self._time_prefix = self._t('thinking_time') + ': '
+        self._nodes_prefix = self._t('nodes_analyzed') + ': '
+        self._depth_prefix = self._t('search_depth') + ': '
     
     def _update_texts(self):
         """更新文本"""
-        self.situation_frame.configure(text=self.translator.get('situation'))
-        self.suggestions_frame.configure(text=self.translator.get('suggestions'))
-        self.info_frame.configure(text=self.translator.get('analysis_info'))
-        
-        self.suggestions_tree.heading('move', text=self.translator.get('move'))
-        self.suggestions_tree.heading('winrate', text=self.translator.get('win_rate'))
-        self.suggestions_tree.heading('visits', text=self.translator.get('visits'))
+        self._refresh_translation_cache()
+        self._set_text(self.situation_frame, self._t('situation'))
+        self._set_text(self.suggestions_frame, self._t('suggestions'))
+        self._set_text(self.info_frame, self._t('analysis_info'))
+        
+        self.suggestions_tree.heading('move', text=self._t('move'))
+        self.suggestions_tree.heading('winrate', text=self._t('win_rate'))
+        self.suggestions_tree.heading('visits', text=self._t('visits'))
     
     def update_winrate(self, winrate: float):
         """
@@ -706,37 +981,31 @@ class AnalysisPanel(BasePanel):
             winrate: 黑方胜率（0-100）
         """
         self._last_winrate = winrate
-        self.winrate_label.configure(
-            text=f"{self.translator.get('black')}: {winrate:.1f}% | "
-                 f"{self.translator.get('white')}: {100-winrate:.1f}%"
+        self._queue('winrate', (winrate,))
+    
+    def _draw_winrate(self, winrate: float):
+        self._set_text(
+            self.winrate_label,
+            f"{self._t_black}: {winrate:.1f}% | {self._t_white}: {100-winrate:.1f}%"
         )
         
-        # 绘制胜率条
-        self.winrate_canvas.delete('all')
-        width = self.winrate_canvas.winfo_width()
+        # 绘制胜率条：宽度取自 <Configure> 记录的值，不再每次查询 winfo_width
+        width = self._wr_last_w
         if width <= 1:
             width = 200  # 默认宽度
+        # 显示精度为 0.1%，四舍五入后相同且宽度未变时无需重绘
+        drawn = (round(winrate, 1), width)
+        if drawn == self._wr_drawn:
+            return
+        self._wr_drawn = drawn
         
         height = 30
         black_width = int(width * winrate / 100)
+        canvas = self.winrate_canvas
         
-        # 黑方部分
-        self.winrate_canvas.create_rectangle(
-            0, 0, black_width, height,
-            fill='#2c2c2c', outline=''
-        )
-        
-        # 白方部分
-        self.winrate_canvas.create_rectangle(
-            black_width, 0, width, height,
-            fill='#e0e0e0', outline=''
-        )
-        
-        # 中线
-        self.winrate_canvas.create_line(
-            width // 2, 0, width // 2, height,
-            fill='red', width=1
-        )
+        # 黑方部分 / 白方部分
+        canvas.coords(self._wr_black, 0, 0, black_width, height)
+        canvas.coords(self._wr_white, black_width, 0, width, height)
         
         # 显示数值
         if winrate > 50:
@@ -748,30 +1017,51 @@ class AnalysisPanel(BasePanel):
             text_color = 'black'
             text = f"{100-winrate:.1f}%"
         
-        self.winrate_canvas.create_text(
-            text_x, height // 2,
-            text=text, fill=text_color,
-            font=('Arial', 10, 'bold')
-        )
+        canvas.coords(self._wr_text, text_x, height // 2)
+        canvas.itemconfigure(self._wr_text, text=text, fill=text_color)
+    
+    def _on_winrate_configure(self, event):
+        """窗口拖动缩放时合并重绘，只在尺寸稳定后绘制一次"""
+        if event.width == self._wr_last_w:
+            return
+        self._wr_last_w = width = event.width
+        self.winrate_canvas.coords(self._wr_midline, width // 2, 0, width // 2, 30)
+        if self._wr_after_id is not None:
+            self.after_cancel(self._wr_after_id)
+        self._wr_after_id = self.after(_WINRATE_RESIZE_DELAY_MS, self._redraw_winrate)
+    
+    def _redraw_winrate(self):
+        self._wr_after_id = None
+        self._draw_winrate(self._last_winrate)
+    
+    def destroy(self):
+        if self._wr_after_id is not None:
+            self.after_cancel(self._wr_after_id)
+            self._wr_after_id = None
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
     
     def update_territory(self, black_territory: int, white_territory: int):
         """更新地盘估算"""
-        self.black_territory_label.configure(
-            text=f"{self.translator.get('black')}: {black_territory}"
-        )
-        self.white_territory_label.configure(
-            text=f"{self.translator.get('white')}: {white_territory}"
-        )
+        self._queue('territory', (black_territory, white_territory))
+    
+    def _draw_territory(self, black_territory: int, white_territory: int):
+        set_text = self._set_text
+        t_black, t_white = self._t_black, self._t_white
+        set_text(self.black_territory_label, f"{t_black}: {black_territory}")
+        set_text(self.white_territory_label, f"{t_white}: {white_territory}")
         
         diff = black_territory - white_territory
         if diff > 0:
-            diff_text = f"{self.translator.get('black')} +{diff}"
+            diff_text = f"{t_black} +{diff}"
         elif diff < 0:
-            diff_text = f"{self.translator.get('white')} +{-diff}"
+            diff_text = f"{t_white} +{-diff}"
         else:
-            diff_text = self.translator.get('even')
+            diff_text = self._t_even
         
-        self.territory_diff_label.configure(text=diff_text)
+        set_text(self.territory_diff_label, diff_text)
     
     def update_suggestions(self, suggestions: List[Dict[str, Any]]):
         """
@@ -780,34 +1070,50 @@ class AnalysisPanel(BasePanel):
         Args:
             suggestions: 推荐列表，每项包含 {move, winrate, visits, pv}
         """
-        # 清空列表
-        for item in self.suggestions_tree.get_children():
-            self.suggestions_tree.delete(item)
-        
-        # 添加新建议
-        for i, suggestion in enumerate(suggestions[:10]):  # 最多显示10个
-            move = suggestion.get('move', '')
-            winrate = suggestion.get('winrate', 0.0)
-            visits = suggestion.get('visits', 0)
-            
-            self.suggestions_tree.insert(
-                '', 'end',
-                text=str(i + 1),
-                values=(move, f"{winrate:.1f}%", visits)
+        self._queue('suggestions', (suggestions,))
+    
+    def _draw_suggestions(self, suggestions: List[Dict[str, Any]]):
+        # 先按显示精度比较原始数据，未变化时连格式化都省去
+        key = tuple(
+            (
+                suggestion.get('move', ''),
+                round(suggestion.get('winrate', 0.0), 1),
+                suggestion.get('visits', 0),
             )
+            for suggestion in suggestions[:_MAX_SUGGESTIONS]
+        )
+        if key == self._last_sugg_key:
+            return
+        self._last_sugg_key = key
+        
+        rows = [(move, f"{winrate:.1f}%", visits) for move, winrate, visits in key]
+        
+        # 只改写内容变化的单元，行数变化时挂回或摘下预建行
+        tree = self.suggestions_tree
+        iids = self._sugg_iids
+        cells = self._sugg_cells
+        for i, values in enumerate(rows):
+            if cells[i] != values:
+                cells[i] = values
+                tree.item(iids[i], values=values)
+        count = len(rows)
+        shown = self._sugg_shown
+        if count < shown:
+            tree.detach(*iids[count:shown])
+        for i in range(shown, count):
+            tree.move(iids[i], '', i)
+        self._sugg_shown = count
     
     def update_analysis_info(self, thinking_time: float = 0.0,
                             nodes: int = 0, depth: int = 0):
         """更新分析信息"""
-        self.thinking_time_label.configure(
-            text=f"{self.translator.get('thinking_time')}: {thinking_time:.1f}s"
-        )
-        self.nodes_label.configure(
-            text=f"{self.translator.get('nodes_analyzed')}: {nodes:,}"
-        )
-        self.depth_label.configure(
-            text=f"{self.translator.get('search_depth')}: {depth}"
-        )
+        self._queue('analysis_info', (thinking_time, nodes, depth))
+    
+    def _draw_analysis_info(self, thinking_time: float, nodes: int, depth: int):
+        set_text = self._set_text
+        set_text(self.thinking_time_label, f"{self._time_prefix}{thinking_time:.1f}s")
+        set_text(self.nodes_label, f"{self._nodes_prefix}{nodes:,}")
+        set_text(self.depth_label, f"{self._depth_prefix}{depth}")
 
     # --- 兼容 main.py 的方法（旧版 UI 调用） ---
 
@@ -820,74 +1126,61 @@ class AnalysisPanel(BasePanel):
         if not analysis:
             return
 
-        # 兼容 dict / dataclass
-        if isinstance(analysis, dict):
-            winrate = analysis.get('winrate', 0.5)
-            territory = analysis.get('territory_estimate', {}) or {}
-            best_moves = analysis.get('best_moves', []) or []
-            depth = analysis.get('analysis_depth', 0) or 0
-        else:
-            winrate = getattr(analysis, 'winrate', 0.5)
-            territory = getattr(analysis, 'territory_estimate', {}) or {}
-            best_moves = getattr(analysis, 'best_moves', []) or []
-            depth = getattr(analysis, 'analysis_depth', 0) or 0
+        # 兼容 dict / dataclass：取值方式按类型选择一次后缓存
+        cls = type(analysis)
+        fields = self._ANALYSIS_EXTRACTORS.get(cls)
+        if fields is None:
+            fields = _dict_analysis_fields if issubclass(cls, dict) else _attr_analysis_fields
+            self._ANALYSIS_EXTRACTORS[cls] = fields
+        winrate, territory, best_moves, depth = fields(analysis)
 
         # 胜率：PositionAnalysis 为 0~1；面板显示使用 0~100
-        try:
-            winrate_value = float(winrate)
-        except Exception:
-            winrate_value = 0.5
+        winrate_value = winrate if type(winrate) is float else _to_float(winrate, 0.5)
         winrate_percent = winrate_value * 100 if winrate_value <= 1.0 else winrate_value
         self.update_winrate(winrate_percent)
 
         # 领地估算
         try:
-            black_terr = int(territory.get('black', 0) or 0)
-            white_terr = int(territory.get('white', 0) or 0)
+            black_terr = territory.get('black', 0) or 0
+            white_terr = territory.get('white', 0) or 0
+            if type(black_terr) is not int or type(white_terr) is not int:
+                black_terr, white_terr = int(black_terr), int(white_terr)
         except Exception:
             black_terr, white_terr = 0, 0
         self.update_territory(black_terr, white_terr)
 
-        # 推荐着法
+        # 推荐着法（单次遍历，同时累计 nodes；同一批结果类型一致，按首项选择取值方式）
         suggestions: List[Dict[str, Any]] = []
-        for move in best_moves:
-            if isinstance(move, dict):
-                move_text = move.get('move')
-                if not move_text:
-                    x, y = move.get('x', -1), move.get('y', -1)
-                    move_text = f"{x},{y}"
-                move_winrate = move.get('winrate', 0.0)
-                visits = int(move.get('visits', 0) or 0)
+        nodes = 0
+        if best_moves:
+            sample = best_moves[0]
+            if isinstance(sample, dict):
+                move_fields = _dict_move_fields
             else:
-                if hasattr(move, 'get_coordinate_string'):
-                    move_text = move.get_coordinate_string()
-                else:
-                    x, y = getattr(move, 'x', -1), getattr(move, 'y', -1)
-                    move_text = f"{x},{y}"
-                move_winrate = getattr(move, 'winrate', 0.0)
-                visits = int(getattr(move, 'visits', 0) or 0)
-
-            try:
-                move_winrate_value = float(move_winrate)
-            except Exception:
-                move_winrate_value = 0.0
-            move_winrate_percent = move_winrate_value * 100 if move_winrate_value <= 1.0 else move_winrate_value
-
-            suggestions.append(
-                {
-                    'move': move_text,
-                    'winrate': move_winrate_percent,
-                    'visits': visits,
-                }
-            )
+                # 坐标方法在类型上查找一次，循环内不再逐个 hasattr
+                move_fields = functools.partial(
+                    _attr_move_fields, getattr(type(sample), 'get_coordinate_string', None)
+                )
+            for move in best_moves:
+                move_text, move_winrate, visits = move_fields(move)
+                nodes += visits
+
+                move_winrate_value = (
+                    move_winrate if type(move_winrate) is float else _to_float(move_winrate, 0.0)
+                )
+                move_winrate_percent = move_winrate_value * 100 if move_winrate_value <= 1.0 else move_winrate_value
+
+                suggestions.append(
+                    {
+                        'move': move_text,
+                        'winrate': move_winrate_percent,
+                        'visits': visits,
+                    }
+                )
         # 始终刷新（空列表也会清空旧内容，避免显示过期建议）
         self.update_suggestions(suggestions)
 
         # 分析信息：当前分析结果不包含真实 nodes/time，做轻量展示
-        try:
-            nodes = int(sum((m.get('visits', 0) if isinstance(m, dict) else getattr(m, 'visits', 0) or 0) for m in best_moves))
-        except Exception:
-            nodes = 0
         self.update_analysis_info(thinking_time=0.0, nodes=nodes, depth=int(depth or 0))
 
 
@@ -900,6 +1193,15 @@ class NavigationPanel(BasePanel):
         self.callbacks: Dict[str, Callable] = {}
         self.total_moves = 0
         self.current_move = 0
+        self._scale_after_id: Optional[str] = None
+        self._scale_pending: Optional[int] = None
+        # (是否在开头, 是否在末尾)；按钮初始均为可用
+        self._nav_state = (False, False)
+        # 进度条以手数为单位：范围 0..max(total, 1)
+        self._scale_to = 1
+        self._last_progress: Optional[int] = None
+        self._last_pos: Optional[Tuple[int, int]] = None
+        self._last_branches: Tuple[str, ...] = ()
         
         self._create_widgets()
         self._update_texts()
@@ -919,37 +1221,37 @@ class NavigationPanel(BasePanel):
         # 导航按钮
         self.first_button = ttk.Button(
             button_frame, text='|◀', width=4, style='Panel.TButton',
-            command=lambda: self._callback('first')
+            command=functools.partial(self._callback, 'first')
         )
         self.first_button.pack(side='left', padx=1)
         
         self.prev10_button = ttk.Button(
             button_frame, text='◀◀', width=4, style='Panel.TButton',
-            command=lambda: self._callback('prev10')
+            command=functools.partial(self._callback, 'prev10')
         )
         self.prev10_button.pack(side='left', padx=1)
         
         self.prev_button = ttk.Button(
             button_frame, text='◀', width=4, style='Panel.TButton',
-            command=lambda: self._callback('prev')
+            command=functools.partial(self._callback, 'prev')
         )
         self.prev_button.pack(side='left', padx=1)
         
         self.next_button = ttk.Button(
             button_frame, text='▶', width=4, style='Panel.TButton',
-            command=lambda: self._callback('next')
+            command=functools.partial(self._callback, 'next')
         )
         self.next_button.pack(side='left', padx=1)
         
         self.next10_button = ttk.Button(
             button_frame, text='▶▶', width=4, style='Panel.TButton',
-            command=lambda: self._callback('next10')
+            command=functools.partial(self._callback, 'next10')
         )
         self.next10_button.pack(side='left', padx=1)
         
         self.last_button = ttk.Button(
             button_frame, text='▶|', width=4, style='Panel.TButton',
-            command=lambda: self._callback('last')
+            command=functools.partial(self._callback, 'last')
         )
         self.last_button.pack(side='left', padx=1)
         
@@ -963,14 +1265,16 @@ class NavigationPanel(BasePanel):
         self.progress_var = tk.IntVar(value=0)
         self.progress_scale = ttk.Scale(
             self.progress_frame,
-            from_=0, to=100,
+            from_=0, to=self._scale_to,
             variable=self.progress_var,
             orient='horizontal',
             command=self._on_scale_change
         )
         self.progress_scale.pack(side='left', fill='x', expand=True, padx=5)
+        # 拖动结束时立即跳到最终位置
+        self.progress_scale.bind('<ButtonRelease-1>', self._flush_scale, add='+')
         
-        self.move_label = ttk.Label(self.progress_frame, style='Panel.TLabel')
+        self.move_label = self._label(self.progress_frame, style='Panel.TLabel')
         self.move_label.pack(side='left', padx=5)
         
         # 分支控制框架
@@ -991,13 +1295,13 @@ class NavigationPanel(BasePanel):
         
         self.create_branch_button = ttk.Button(
             branch_button_frame, width=10, style='Panel.TButton',
-            command=lambda: self._callback('create_branch')
+            command=functools.partial(self._callback, 'create_branch')
         )
         self.create_branch_button.pack(side='left', padx=2, pady=2)
         
         self.delete_branch_button = ttk.Button(
             branch_button_frame, width=10, style='Panel.TButton',
-            command=lambda: self._callback('delete_branch')
+            command=functools.partial(self._callback, 'delete_branch')
         )
         self.delete_branch_button.pack(side='left', padx=2, pady=2)
         
@@ -1009,7 +1313,7 @@ class NavigationPanel(BasePanel):
         
         self.autoplay_button = ttk.Button(
             self.autoplay_frame, width=10, style='Panel.TButton',
-            command=lambda: self._callback('toggle_autoplay')
+            command=functools.partial(self._callback, 'toggle_autoplay')
         )
         self.autoplay_button.pack(side='left', padx=5, pady=5)
         
@@ -1031,14 +1335,14 @@ class NavigationPanel(BasePanel):
     
     def _update_texts(self):
         """更新文本"""
-        self.nav_frame.configure(text=self.translator.get('navigation'))
-        self.branch_frame.configure(text=self.translator.get('branches'))
-        self.autoplay_frame.configure(text=self.translator.get('auto_play'))
-        
-        self.create_branch_button.configure(text=self.translator.get('create'))
-        self.delete_branch_button.configure(text=self.translator.get('delete'))
-        self.autoplay_button.configure(text=self.translator.get('play'))
-        self.speed_label.configure(text=self.translator.get('speed'))
+        self._set_text(self.nav_frame, self._t('navigation'))
+        self._set_text(self.branch_frame, self._t('branches'))
+        self._set_text(self.autoplay_frame, self._t('auto_play'))
+        
+        self._set_text(self.create_branch_button, self._t('create'))
+        self._set_text(self.delete_branch_button, self._t('delete'))
+        self._set_text(self.autoplay_button, self._t('play'))
+        self._set_text(self.speed_label, self._t('speed'))
     
     def _callback(self, name: str, *args):
         """执行回调"""
@@ -1046,49 +1350,83 @@ class NavigationPanel(BasePanel):
             self.callbacks[name](*args)
     
     def _on_scale_change(self, value):
-        """处理进度条变化"""
-        move_num = int(float(value) * self.total_moves / 100)
+        """处理进度条变化：拖动过程中合并跳转，只执行最新位置"""
+        self._scale_pending = min(round(float(value)), self.total_moves)
+        if self._scale_after_id is None:
+            self._scale_after_id = self.after(_SCALE_GOTO_DELAY_MS, self._flush_scale)
+    
+    def _flush_scale(self, _event=None):
+        """执行积压的进度条跳转"""
+        if self._scale_after_id is not None:
+            self.after_cancel(self._scale_after_id)
+            self._scale_after_id = None
+        move_num = self._scale_pending
+        self._scale_pending = None
+        # 拖回当前所在手时无需跳转
+        if move_num is None or move_num == self.current_move:
+            return
         self._callback('goto', move_num)
     
+    def destroy(self):
+        if self._scale_after_id is not None:
+            self.after_cancel(self._scale_after_id)
+            self._scale_after_id = None
+        super().destroy()
+    
     def set_callbacks(self, callbacks: Dict[str, Callable]):
         """设置回调函数"""
         self.callbacks.update(callbacks)
     
     def update_position(self, current: int, total: int):
         """更新位置显示"""
+        pos = (current, total)
+        if pos == self._last_pos:
+            return
+        self._last_pos = pos
         self.current_move = current
         self.total_moves = total
         
         # 更新标签
-        self.move_label.configure(text=f"{current}/{total}")
-        
-        # 更新进度条
-        if total > 0:
-            progress = int(current * 100 / total)
-            self.progress_var.set(progress)
-        else:
-            self.progress_var.set(0)
-        
-        # 更新按钮状态
-        self.first_button.configure(state='normal' if current > 0 else 'disabled')
-        self.prev10_button.configure(state='normal' if current > 0 else 'disabled')
-        self.prev_button.configure(state='normal' if current > 0 else 'disabled')
-        self.next_button.configure(state='normal' if current < total else 'disabled')
-        self.next10_button.configure(state='normal' if current < total else 'disabled')
-        self.last_button.configure(state='normal' if current < total else 'disabled')
+        self._set_text(self.move_label, f"{current}/{total}")
+        
+        # 更新进度条（直接以手数为刻度）
+        scale_to = max(total, 1)
+        if scale_to != self._scale_to:
+            self._scale_to = scale_to
+            self.progress_scale.configure(to=scale_to)
+        if current != self._last_progress:
+            self._last_progress = current
+            self.progress_var.set(current)
+        
+        # 更新按钮状态：只在到达/离开开头或末尾时切换
+        at_start = current <= 0
+        at_end = current >= total
+        prev_start, prev_end = self._nav_state
+        if at_start != prev_start:
+            state = 'disabled' if at_start else 'normal'
+            for button in (self.first_button, self.prev10_button, self.prev_button):
+                button.configure(state=state)
+        if at_end != prev_end:
+            state = 'disabled' if at_end else 'normal'
+            for button in (self.next_button, self.next10_button, self.last_button):
+                button.configure(state=state)
+        self._nav_state = (at_start, at_end)
     
     def update_branches(self, branches: List[str], current_branch: str = None):
         """更新分支列表"""
-        self.branch_combo['values'] = branches
-        if current_branch:
+        values = tuple(branches)
+        if values != self._last_branches:
+            self._last_branches = values
+            self.branch_combo['values'] = values
+        if current_branch and current_branch != self.branch_combo.get():
             self.branch_combo.set(current_branch)
     
     def set_autoplay_state(self, is_playing: bool):
         """设置自动播放状态"""
         if is_playing:
-            self.autoplay_button.configure(text=self.translator.get('pause'))
+            self._set_text(self.autoplay_button, self._t('pause'))
         else:
-            self.autoplay_button.configure(text=self.translator.get('play'))
+            self._set_text(self.autoplay_button, self._t('play'))
 
 
 # 导出所有面板类
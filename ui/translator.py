@@ -3,7 +3,7 @@
 支持中文、英文、日文、韩文等多种语言
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import json
 import os
 from pathlib import Path
@@ -1520,6 +1520,23 @@ class Translator:
         
         return text
     
+    def getmany(self, keys: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        批量获取翻译文本（不支持格式化参数）
+        
+        Args:
+            keys: 翻译键序列
+            
+        Returns:
+            与 keys 顺序一致的翻译文本
+        """
+        lang_dict = self.translations.get(self.language, {})
+        en_dict = self.translations.get('en', {})
+        return tuple(
+            lang_dict[key] if key in lang_dict else en_dict.get(key, key)
+            for key in keys
+        )
+    
     def set_language(self, language: str):
         """
         设置语言